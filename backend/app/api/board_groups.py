@@ -55,8 +55,11 @@ ORG_ADMIN_DEP = Depends(require_org_admin)
 ACTOR_DEP = Depends(require_admin_or_agent)
 
 
+_SLUG_STRIP = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_STRIP.sub("-", value.lower()).strip("-")
     return slug or uuid4().hex
 
 
@@ -44,8 +44,7 @@ def _to_definition_read_payload(
     board_ids: list[UUID],
 ) -> TaskCustomFieldDefinitionRead:
     payload = TaskCustomFieldDefinitionRead.model_validate(definition, from_attributes=True)
-    payload.board_ids = board_ids
-    return payload
+    return payload.model_copy(update={"board_ids": board_ids})
 
 
 async def _board_ids_by_definition_id(
@@ -48,6 +48,7 @@ from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.task_custom_fields import (
     TaskCustomFieldType,
     TaskCustomFieldValues,
+    get_definition_pattern,
     validate_custom_field_value,
 )
 from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
@@ -813,11 +814,17 @@ def _reject_invalid_custom_field_values(
 ) -> None:
     for field_key, value in custom_field_values.items():
         definition = definitions_by_key[field_key]
+        compiled_regex = (
+            get_definition_pattern(definition.id, definition.validation_regex)
+            if definition.validation_regex is not None
+            else None
+        )
         try:
             validate_custom_field_value(
                 field_type=definition.field_type,
                 value=value,
                 validation_regex=definition.validation_regex,
+                compiled_regex=compiled_regex,
             )
         except ValueError as err:
             raise HTTPException(
@@ -1066,15 +1073,14 @@ async def _task_read_page(
         if task.status == "done":
             blocked_by = []
         output.append(
-            TaskRead.model_validate(task, from_attributes=True).model_copy(
-                update={
-                    "depends_on_task_ids": dep_list,
-                    "tag_ids": tag_state.tag_ids,
-                    "tags": tag_state.tags,
-                    "blocked_by_task_ids": blocked_by,
-                    "is_blocked": bool(blocked_by),
-                    "custom_field_values": custom_field_values_by_task_id.get(task.id, {}),
-                },
+            TaskRead.from_db(
+                task,
+                depends_on_task_ids=dep_list,
+                tag_ids=tag_state.tag_ids,
+                tags=tag_state.tags,
+                blocked_by_task_ids=blocked_by,
+                is_blocked=bool(blocked_by),
+                custom_field_values=custom_field_values_by_task_id.get(task.id, {}),
             ),
         )
     return output
@@ -1154,23 +1160,18 @@ def _task_event_payload(
     )
     if task.status == "done":
         blocked_by = []
-    payload["task"] = (
-        TaskRead.model_validate(task, from_attributes=True)
-        .model_copy(
-            update={
-                "depends_on_task_ids": dep_list,
-                "tag_ids": tag_state.tag_ids,
-                "tags": tag_state.tags,
-                "blocked_by_task_ids": blocked_by,
-                "is_blocked": bool(blocked_by),
-                "custom_field_values": resolved_custom_field_values_by_task_id.get(
-                    task.id,
-                    {},
-                ),
-            },
-        )
-        .model_dump(mode="json")
-    )
+    payload["task"] = TaskRead.from_db(
+        task,
+        depends_on_task_ids=dep_list,
+        tag_ids=tag_state.tag_ids,
+        tags=tag_state.tags,
+        blocked_by_task_ids=blocked_by,
+        is_blocked=bool(blocked_by),
+        custom_field_values=resolved_custom_field_values_by_task_id.get(
+            task.id,
+            {},
+        ),
+    ).model_dump(mode="json")
     return payload
 
 
@@ -1757,15 +1758,14 @@ async def _task_read_response(
     )
     if task.status == "done":
         blocked_ids = []
-    return TaskRead.model_validate(task, from_attributes=True).model_copy(
-        update={
-            "depends_on_task_ids": dep_ids,
-            "tag_ids": tag_state.tag_ids,
-            "tags": tag_state.tags,
-            "blocked_by_task_ids": blocked_ids,
-            "is_blocked": bool(blocked_ids),
-            "custom_field_values": custom_field_values_by_task_id.get(task.id, {}),
-        },
+    return TaskRead.from_db(
+        task,
+        depends_on_task_ids=dep_ids,
+        tag_ids=tag_state.tag_ids,
+        tags=tag_state.tags,
+        blocked_by_task_ids=blocked_ids,
+        is_blocked=bool(blocked_ids),
+        custom_field_values=custom_field_values_by_task_id.get(task.id, {}),
     )
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from sqlalchemy import delete as sql_delete
+from sqlalchemy import insert as sql_insert
 from sqlalchemy import update as sql_update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlmodel import SQLModel, select
@@ -115,6 +116,32 @@ async def create(
     return obj
 
 
+async def create_many(
+    session: AsyncSession,
+    model: type[ModelT],
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    batch_size: int = 500,
+    commit: bool = True,
+) -> int:
+    """Bulk-insert row mappings with batched multi-row INSERTs.
+
+    One executemany statement per batch replaces per-object add+flush round
+    trips. Rows bypass model validation and no ORM instances are returned,
+    so this is for trusted payloads where ids are pre-assigned or unneeded.
+    Returns the number of rows inserted.
+    """
+    payload = [dict(row) for row in rows]
+    if not payload:
+        return 0
+    stmt: Any = sql_insert(model)
+    for start in range(0, len(payload), batch_size):
+        await session.exec(stmt, params=payload[start : start + batch_size])
+    if commit:
+        await _commit_or_rollback(session)
+    return len(payload)
+
+
 async def save(
     session: AsyncSession,
     obj: ModelT,
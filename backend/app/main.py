@@ -36,6 +36,8 @@ from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
+from app.services.openclaw.gateway_rpc import close_gateway_connections
+from app.services.souls_directory import close_shared_client
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -440,6 +442,8 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        await close_gateway_connections()
+        await close_shared_client()
         logger.info("app.lifecycle.stopped")
 
 
@@ -22,6 +22,7 @@ class BoardWebhook(QueryModel, table=True):
     board_id: UUID = Field(foreign_key="boards.id", index=True)
     agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
     description: str
-    enabled: bool = Field(default=True, index=True)
+    # Checked on loaded rows, never filtered in SQL, so no index.
+    enabled: bool = Field(default=True)
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
@@ -61,7 +61,9 @@ class BoardTaskCustomField(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    board_id: UUID = Field(foreign_key="boards.id", index=True)
+    # board_id lookups use the leftmost prefix of the unique
+    # (board_id, definition_id) btree, so no single-column index.
+    board_id: UUID = Field(foreign_key="boards.id")
     task_custom_field_definition_id: UUID = Field(
         foreign_key="task_custom_field_definitions.id",
         index=True,
@@ -82,7 +84,9 @@ class TaskCustomFieldValue(TenantScoped, table=True):
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    task_id: UUID = Field(foreign_key="tasks.id", index=True)
+    # task_id lookups use the leftmost prefix of the unique
+    # (task_id, definition_id) btree, so no single-column index.
+    task_id: UUID = Field(foreign_key="tasks.id")
     task_custom_field_definition_id: UUID = Field(
         foreign_key="task_custom_field_definitions.id",
         index=True,
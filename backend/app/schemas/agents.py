@@ -13,8 +13,6 @@ from sqlmodel._compat import SQLModelConfig
 
 from app.schemas.common import NonEmptyStr
 
-_RUNTIME_TYPE_REFERENCES = (datetime, UUID, NonEmptyStr)
-
 
 def _normalize_identity_profile(
     profile: object,
@@ -216,6 +214,8 @@ class AgentRead(AgentBase):
     """Public agent representation returned by the API."""
 
     model_config = SQLModelConfig(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "x-llm-intent": "agent_profile_lookup",
             "x-when-to-use": [
@@ -8,11 +8,11 @@ from uuid import UUID
 
 from pydantic import model_validator
 from sqlmodel import Field, SQLModel
+from sqlmodel._compat import SQLModelConfig
 
 ApprovalStatus = Literal["pending", "approved", "rejected"]
 STATUS_REQUIRED_ERROR = "status is required"
 LEAD_REASONING_REQUIRED_ERROR = "lead reasoning is required"
-RUNTIME_ANNOTATION_TYPES = (datetime, UUID)
 
 
 class ApprovalBase(SQLModel):
@@ -78,17 +78,22 @@ class ApprovalUpdate(SQLModel):
 
     status: ApprovalStatus | None = None
 
-    @model_validator(mode="after")
-    def validate_status(self) -> Self:
-        """Ensure explicitly provided `status` is not null."""
-        if "status" in self.model_fields_set and self.status is None:
+    @model_validator(mode="before")
+    @classmethod
+    def validate_status(cls, data: object) -> object:
+        """Reject explicitly null `status` before the model is built."""
+        if isinstance(data, dict) and "status" in data and data["status"] is None:
             raise ValueError(STATUS_REQUIRED_ERROR)
-        return self
+        return data
 
 
 class ApprovalRead(ApprovalBase):
     """Approval payload returned from read endpoints."""
 
+    # Not frozen: the inherited normalize_task_links validator assigns to the
+    # instance after construction.
+    model_config = SQLModelConfig(extra="forbid")
+
     id: UUID
     board_id: UUID
     task_titles: list[str] = Field(default_factory=list)
@@ -8,11 +8,11 @@ from uuid import UUID
 
 from pydantic import Field, field_validator, model_validator
 from sqlmodel import SQLModel
+from sqlmodel._compat import SQLModelConfig
 
+from app.schemas.agents import _normalize_identity_profile
 from app.schemas.common import NonEmptyStr
 
-_RUNTIME_TYPE_REFERENCES = (datetime, UUID, NonEmptyStr)
-
 
 class BoardOnboardingStart(SQLModel):
     """Start signal for initializing onboarding conversation."""
@@ -126,21 +126,9 @@ class BoardOnboardingLeadAgentDraft(SQLModel):
         value: object,
     ) -> object | None:
         """Normalize identity profile keys and values as trimmed strings."""
-        if value is None:
-            return None
-        if not isinstance(value, dict):
+        if value is None or not isinstance(value, dict):
             return value
-        normalized: dict[str, str] = {}
-        for raw_key, raw_val in value.items():
-            if raw_val is None:
-                continue
-            key = str(raw_key).strip()
-            if not key:
-                continue
-            val = str(raw_val).strip()
-            if val:
-                normalized[key] = val
-        return normalized or None
+        return _normalize_identity_profile(value)
 
 
 class BoardOnboardingAgentComplete(BoardOnboardingConfirm):
@@ -157,6 +145,8 @@ BoardOnboardingAgentUpdate = BoardOnboardingAgentComplete | BoardOnboardingAgent
 class BoardOnboardingRead(SQLModel):
     """Stored onboarding session state returned by API endpoints."""
 
+    model_config = SQLModelConfig(frozen=True, extra="forbid")
+
     id: UUID
     board_id: UUID
     session_key: str
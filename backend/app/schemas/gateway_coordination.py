@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Final, Literal
 from uuid import UUID
 
 from pydantic import Field
@@ -13,13 +13,18 @@ from app.schemas.common import NonEmptyStr
 
 RUNTIME_ANNOTATION_TYPES = (UUID, NonEmptyStr)
 
+# Shared immutable defaults; the factories copy once per instance instead of
+# rebuilding the literal each call.
+LEAD_REPLY_TAGS: Final[tuple[str, ...]] = ("gateway_main", "lead_reply")
+USER_REPLY_TAGS: Final[tuple[str, ...]] = ("gateway_main", "user_reply")
+
 
 def _lead_reply_tags() -> list[str]:
-    return ["gateway_main", "lead_reply"]
+    return list(LEAD_REPLY_TAGS)
 
 
 def _user_reply_tags() -> list[str]:
-    return ["gateway_main", "user_reply"]
+    return list(USER_REPLY_TAGS)
 
 
 class GatewayLeadMessageRequest(SQLModel):
@@ -73,6 +78,8 @@ class GatewayLeadMessageResponse(SQLModel):
     """Response payload for a lead-message dispatch attempt."""
 
     model_config = SQLModelConfig(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "x-llm-intent": "lead_direct_message_result",
             "x-when-to-use": [
@@ -156,6 +163,8 @@ class GatewayLeadBroadcastBoardResult(SQLModel):
     """Per-board result entry for a lead broadcast operation."""
 
     model_config = SQLModelConfig(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "x-llm-intent": "lead_broadcast_status",
             "x-when-to-use": [
@@ -186,6 +195,8 @@ class GatewayLeadBroadcastResponse(SQLModel):
     """Aggregate response for a lead broadcast operation."""
 
     model_config = SQLModelConfig(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "x-llm-intent": "lead_broadcast_summary",
             "x-when-to-use": [
@@ -254,6 +265,8 @@ class GatewayMainAskUserResponse(SQLModel):
     """Response payload for user-question dispatch via gateway main agent."""
 
     model_config = SQLModelConfig(
+        frozen=True,
+        extra="forbid",
         json_schema_extra={
             "x-llm-intent": "human_escalation_result",
             "x-when-to-use": [
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable
 from datetime import date, datetime
 from typing import Literal, Self
 from urllib.parse import urlparse
@@ -10,11 +12,10 @@ from uuid import UUID
 
 from pydantic import Field, field_validator, model_validator
 from sqlmodel import SQLModel
+from sqlmodel._compat import SQLModelConfig
 
 from app.schemas.common import NonEmptyStr
 
-RUNTIME_ANNOTATION_TYPES = (datetime, UUID, date)
-
 TaskCustomFieldType = Literal[
     "text",
     "text_long",
@@ -54,6 +55,24 @@ TASK_CUSTOM_FIELD_UI_VISIBILITY_ALIASES: dict[str, TaskCustomFieldUiVisibility]
 # Reusable alias for task payload payloads containing custom-field values.
 TaskCustomFieldValues = dict[str, object | None]
 
+# Compiled validation_regex patterns keyed by definition id so task-value
+# writes skip recompiling a pattern that was already validated at
+# definition-create time.
+_DEFINITION_PATTERN_CACHE: dict[UUID, re.Pattern[str]] = {}
+
+
+def get_definition_pattern(definition_id: UUID, validation_regex: str) -> re.Pattern[str]:
+    """Return the compiled pattern for a definition, compiling at most once per id.
+
+    The cached entry is replaced when the stored regex changes (definition
+    updates reuse the same id).
+    """
+    pattern = _DEFINITION_PATTERN_CACHE.get(definition_id)
+    if pattern is None or pattern.pattern != validation_regex:
+        pattern = re.compile(validation_regex)
+        _DEFINITION_PATTERN_CACHE[definition_id] = pattern
+    return pattern
+
 
 class TaskCustomFieldDefinitionBase(SQLModel):
     """Shared custom field definition properties."""
@@ -70,13 +89,18 @@ class TaskCustomFieldDefinitionBase(SQLModel):
     @field_validator("field_key", mode="before")
     @classmethod
     def normalize_field_key(cls, value: object) -> object:
-        """Normalize field keys to a stable lowercase representation."""
+        """Normalize field keys to a stable lowercase representation.
+
+        Keys stay case-sensitive but are interned: they recur as dict keys in
+        every custom-field-values payload, so interning lets CPython's dict
+        lookup short-circuit on pointer identity.
+        """
         if not isinstance(value, str):
             raise ValueError("field_key must be a string")
         normalized = value.strip()
         if not normalized:
             raise ValueError("field_key is required")
-        return normalized
+        return sys.intern(normalized)
 
     @field_validator("label", mode="before")
     @classmethod
@@ -169,6 +193,11 @@ class TaskCustomFieldDefinitionCreate(TaskCustomFieldDefinitionBase):
         return self
 
 
+_NON_NULLABLE_UPDATE_FIELDS: frozenset[str] = frozenset(
+    {"label", "field_type", "ui_visibility", "required"},
+)
+
+
 class TaskCustomFieldDefinitionUpdate(SQLModel):
     """Payload for editing an existing task custom field definition."""
 
@@ -227,12 +256,10 @@ class TaskCustomFieldDefinitionUpdate(SQLModel):
     @model_validator(mode="after")
     def reject_null_for_non_nullable_fields(self) -> Self:
         """Reject explicit null for non-nullable update fields."""
-        non_nullable_fields = ("label", "field_type", "ui_visibility", "required")
-        invalid = [
-            field_name
-            for field_name in non_nullable_fields
-            if field_name in self.model_fields_set and getattr(self, field_name) is None
-        ]
+        touched = self.model_fields_set & _NON_NULLABLE_UPDATE_FIELDS
+        if not touched:
+            return self
+        invalid = sorted(field_name for field_name in touched if getattr(self, field_name) is None)
         if invalid:
             raise ValueError(
                 f"{', '.join(invalid)} cannot be null; omit the field to leave it unchanged",
@@ -250,6 +277,8 @@ class TaskCustomFieldDefinitionUpdate(SQLModel):
 class TaskCustomFieldDefinitionRead(TaskCustomFieldDefinitionBase):
     """Payload returned for custom field definitions."""
 
+    model_config = SQLModelConfig(frozen=True, extra="forbid")
+
     id: UUID
     organization_id: UUID
     label: str
@@ -270,6 +299,8 @@ class BoardTaskCustomFieldCreate(SQLModel):
 class BoardTaskCustomFieldRead(SQLModel):
     """Payload returned when listing board-bound custom fields."""
 
+    model_config = SQLModelConfig(frozen=True, extra="forbid")
+
     id: UUID
     board_id: UUID
     task_custom_field_definition_id: UUID
@@ -297,56 +328,100 @@ def _parse_iso_datetime(value: str) -> datetime:
     return datetime.fromisoformat(normalized)
 
 
+def _validate_text_value(value: object) -> None:
+    if not isinstance(value, str):
+        raise ValueError("must be a string")
+
+
+def _validate_integer_value(value: object) -> None:
+    # Exact type checks: bool subclasses int, and pointer comparison avoids
+    # the isinstance MRO walk on this hot path.
+    if type(value) is not int:
+        raise ValueError("must be an integer")
+
+
+def _validate_decimal_value(value: object) -> None:
+    value_type = type(value)
+    if value_type is not int and value_type is not float:
+        raise ValueError("must be a decimal number")
+
+
+def _validate_boolean_value(value: object) -> None:
+    if not isinstance(value, bool):
+        raise ValueError("must be true or false")
+
+
+def _validate_date_value(value: object) -> None:
+    if not isinstance(value, str):
+        raise ValueError("must be an ISO date string (YYYY-MM-DD)")
+    try:
+        date.fromisoformat(value)
+    except ValueError as exc:
+        raise ValueError("must be an ISO date string (YYYY-MM-DD)") from exc
+
+
+def _validate_date_time_value(value: object) -> None:
+    if not isinstance(value, str):
+        raise ValueError("must be an ISO datetime string")
+    try:
+        _parse_iso_datetime(value)
+    except ValueError as exc:
+        raise ValueError("must be an ISO datetime string") from exc
+
+
+def _validate_url_value(value: object) -> None:
+    if not isinstance(value, str):
+        raise ValueError("must be a URL string")
+    parsed = urlparse(value)
+    if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+        raise ValueError("must be a valid http/https URL")
+
+
+def _validate_json_value(value: object) -> None:
+    if not isinstance(value, (dict, list)):
+        raise ValueError("must be a JSON object or array")
+
+
+# Hash dispatch beats the previous if/elif ladder when boards carry many
+# custom fields; each entry is a small specialized callable.
+_VALUE_VALIDATORS: dict[str, Callable[[object], None]] = {
+    "text": _validate_text_value,
+    "text_long": _validate_text_value,
+    "integer": _validate_integer_value,
+    "decimal": _validate_decimal_value,
+    "boolean": _validate_boolean_value,
+    "date": _validate_date_value,
+    "date_time": _validate_date_time_value,
+    "url": _validate_url_value,
+    "json": _validate_json_value,
+}
+
+
 def validate_custom_field_value(
     *,
     field_type: TaskCustomFieldType,
     value: object | None,
     validation_regex: str | None = None,
+    compiled_regex: re.Pattern[str] | None = None,
 ) -> None:
-    """Validate a custom field value against field type and optional regex."""
+    """Validate a custom field value against field type and optional regex.
+
+    Callers on hot paths may pass ``compiled_regex`` (see
+    ``get_definition_pattern``) to skip per-value pattern compilation.
+    """
     if value is None:
         return
 
-    if field_type in {"text", "text_long"}:
-        if not isinstance(value, str):
-            raise ValueError("must be a string")
-    elif field_type == "integer":
-        if not isinstance(value, int) or isinstance(value, bool):
-            raise ValueError("must be an integer")
-    elif field_type == "decimal":
-        if (not isinstance(value, (int, float))) or isinstance(value, bool):
-            raise ValueError("must be a decimal number")
-    elif field_type == "boolean":
-        if not isinstance(value, bool):
-            raise ValueError("must be true or false")
-    elif field_type == "date":
-        if not isinstance(value, str):
-            raise ValueError("must be an ISO date string (YYYY-MM-DD)")
-        try:
-            date.fromisoformat(value)
-        except ValueError as exc:
-            raise ValueError("must be an ISO date string (YYYY-MM-DD)") from exc
-    elif field_type == "date_time":
-        if not isinstance(value, str):
-            raise ValueError("must be an ISO datetime string")
-        try:
-            _parse_iso_datetime(value)
-        except ValueError as exc:
-            raise ValueError("must be an ISO datetime string") from exc
-    elif field_type == "url":
-        if not isinstance(value, str):
-            raise ValueError("must be a URL string")
-        parsed = urlparse(value)
-        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
-            raise ValueError("must be a valid http/https URL")
-    elif field_type == "json":
-        if not isinstance(value, (dict, list)):
-            raise ValueError("must be a JSON object or array")
-
-    if validation_regex is not None and field_type in STRING_FIELD_TYPES:
+    validator = _VALUE_VALIDATORS.get(field_type)
+    if validator is not None:
+        validator(value)
+
+    if compiled_regex is None and validation_regex is not None:
+        compiled_regex = re.compile(validation_regex)
+    if compiled_regex is not None and field_type in STRING_FIELD_TYPES:
         if not isinstance(value, str):
             raise ValueError("must be a string for regex validation")
-        if re.fullmatch(validation_regex, value) is None:
+        if compiled_regex.fullmatch(value) is None:
             raise ValueError("does not match validation_regex")
 
 
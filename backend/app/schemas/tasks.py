@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Self
+from typing import Any, Literal, Self, cast
 from uuid import UUID
 
 from pydantic import field_validator, model_validator
@@ -72,6 +72,9 @@ class TaskUpdate(SQLModel):
         return self
 
 
+_UNSET = object()
+
+
 class TaskRead(TaskBase):
     """Task payload returned from read endpoints."""
 
@@ -86,6 +89,27 @@ class TaskRead(TaskBase):
     tags: list[TagRef] = Field(default_factory=list)
     custom_field_values: TaskCustomFieldValues | None = None
 
+    @classmethod
+    def from_db(cls, task: object, **overrides: object) -> Self:
+        """Hydrate from a trusted ORM row without re-running validation.
+
+        DB rows are already typed by SQLAlchemy, so ``model_construct`` skips
+        the per-field validator dispatch that ``model_validate`` would repeat
+        for every task in a listing. Keep ``model_validate`` for untrusted
+        input such as ``TaskCreate``/``TaskUpdate`` payloads.
+        """
+        values: dict[str, Any] = {}
+        for name in cls.model_fields:
+            if name in overrides:
+                values[name] = overrides[name]
+            else:
+                value = getattr(task, name, _UNSET)
+                if value is not _UNSET:
+                    values[name] = value
+        # The pydantic mypy plugin types model_construct as returning the
+        # concrete class rather than Self; cast keeps subclasses typed.
+        return cast("Self", cls.model_construct(**values))
+
 
 class TaskCommentCreate(SQLModel):
     """Payload for creating a task comment."""
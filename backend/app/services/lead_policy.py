@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from typing import Mapping
 
 CONFIDENCE_THRESHOLD = 80.0
@@ -26,8 +27,13 @@ def infer_planning(signals: Mapping[str, bool]) -> bool:
     return len(truthy) >= MIN_PLANNING_SIGNALS
 
 
+@lru_cache(maxsize=8192)
 def task_fingerprint(title: str, description: str | None, board_id: str) -> str:
-    """Build a stable hash key for deduplicating similar board tasks."""
+    """Build a stable hash key for deduplicating similar board tasks.
+
+    Pure function of its string inputs, and boards re-fingerprint the same
+    task repeatedly during dedup scans, so repeat calls hit the cache.
+    """
     normalized_title = title.strip().lower()
     normalized_desc = (description or "").strip().lower()
     seed = f"{board_id}::{normalized_title}::{normalized_desc}"
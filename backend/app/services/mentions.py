@@ -14,7 +14,7 @@ MENTION_PATTERN = re.compile(r"@([A-Za-z][\w-]{0,31})")
 
 def extract_mentions(message: str) -> set[str]:
     """Extract normalized mention handles from a message body."""
-    return {match.group(1).lower() for match in MENTION_PATTERN.finditer(message)}
+    return {match.lower() for match in MENTION_PATTERN.findall(message)}
 
 
 def matches_agent_mention(agent: Agent, mentions: set[str]) -> bool:
@@ -18,6 +18,8 @@ from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.schemas.gateway_coordination import (
+    LEAD_REPLY_TAGS,
+    USER_REPLY_TAGS,
     GatewayLeadBroadcastBoardResult,
     GatewayLeadBroadcastRequest,
     GatewayLeadBroadcastResponse,
@@ -97,7 +99,7 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
         header = "GATEWAY MAIN QUESTION" if kind == "question" else "GATEWAY MAIN HANDOFF"
         correlation = correlation_id.strip() if correlation_id else ""
         correlation_line = f"Correlation ID: {correlation}\n" if correlation else ""
-        tags_json = json.dumps(reply_tags or ["gateway_main", "lead_reply"])
+        tags_json = json.dumps(reply_tags or list(LEAD_REPLY_TAGS))
         source = reply_source or "lead_to_gateway_main"
         return (
             f"{header}\n"
@@ -434,7 +436,7 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
         correlation_line = f"Correlation ID: {correlation}\n" if correlation else ""
         preferred_channel = (payload.preferred_channel or "").strip()
         channel_line = f"Preferred channel: {preferred_channel}\n" if preferred_channel else ""
-        tags = payload.reply_tags or ["gateway_main", "user_reply"]
+        tags = payload.reply_tags or list(USER_REPLY_TAGS)
         tags_json = json.dumps(tags)
         reply_source = payload.reply_source or "user_via_gateway_main"
         base_url = settings.base_url or "http://localhost:8000"
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import Enum
 
 from fastapi import HTTPException, status
@@ -21,47 +20,22 @@ class GatewayOperation(str, Enum):
     ONBOARDING_ANSWER_DISPATCH = "onboarding_answer_dispatch"
 
 
-@dataclass(frozen=True, slots=True)
-class GatewayErrorPolicy:
-    """HTTP policy for mapping gateway operation failures."""
-
-    status_code: int
-    detail_template: str
-
-
-_GATEWAY_ERROR_POLICIES: dict[GatewayOperation, GatewayErrorPolicy] = {
-    GatewayOperation.NUDGE_AGENT: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway nudge failed: {error}",
-    ),
-    GatewayOperation.SOUL_READ: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway SOUL read failed: {error}",
-    ),
-    GatewayOperation.SOUL_WRITE: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway SOUL update failed: {error}",
-    ),
-    GatewayOperation.ASK_USER_DISPATCH: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway ask-user dispatch failed: {error}",
-    ),
-    GatewayOperation.LEAD_MESSAGE_DISPATCH: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway lead message dispatch failed: {error}",
-    ),
-    GatewayOperation.LEAD_BROADCAST_DISPATCH: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway lead broadcast dispatch failed: {error}",
-    ),
-    GatewayOperation.ONBOARDING_START_DISPATCH: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway onboarding start dispatch failed: {error}",
-    ),
-    GatewayOperation.ONBOARDING_ANSWER_DISPATCH: GatewayErrorPolicy(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail_template="Gateway onboarding answer dispatch failed: {error}",
-    ),
+# Every operation maps to 502 with a constant detail prefix; precomputing the
+# prefix avoids re-parsing a format template on every failure.
+_BAD_GATEWAY: int = status.HTTP_502_BAD_GATEWAY
+_GATEWAY_OPERATION_LABELS: tuple[tuple[GatewayOperation, str], ...] = (
+    (GatewayOperation.NUDGE_AGENT, "nudge"),
+    (GatewayOperation.SOUL_READ, "SOUL read"),
+    (GatewayOperation.SOUL_WRITE, "SOUL update"),
+    (GatewayOperation.ASK_USER_DISPATCH, "ask-user dispatch"),
+    (GatewayOperation.LEAD_MESSAGE_DISPATCH, "lead message dispatch"),
+    (GatewayOperation.LEAD_BROADCAST_DISPATCH, "lead broadcast dispatch"),
+    (GatewayOperation.ONBOARDING_START_DISPATCH, "onboarding start dispatch"),
+    (GatewayOperation.ONBOARDING_ANSWER_DISPATCH, "onboarding answer dispatch"),
+)
+_GATEWAY_ERROR_PREFIXES: dict[GatewayOperation, tuple[int, str]] = {
+    operation: (_BAD_GATEWAY, f"Gateway {label} failed: ")
+    for operation, label in _GATEWAY_OPERATION_LABELS
 }
 
 
@@ -70,11 +44,8 @@ def map_gateway_error_to_http_exception(
     exc: Exception,
 ) -> HTTPException:
     """Map a gateway failure into a typed HTTP exception."""
-    policy = _GATEWAY_ERROR_POLICIES[operation]
-    return HTTPException(
-        status_code=policy.status_code,
-        detail=policy.detail_template.format(error=str(exc)),
-    )
+    status_code, prefix = _GATEWAY_ERROR_PREFIXES[operation]
+    return HTTPException(status_code=status_code, detail=prefix + str(exc))
 
 
 def map_gateway_error_message(
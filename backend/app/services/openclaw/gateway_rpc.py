@@ -11,6 +11,7 @@ import asyncio
 import json
 import ssl
 from dataclasses import dataclass
+from functools import lru_cache
 from time import perf_counter, time
 from typing import Any, Literal
 from urllib.parse import urlencode, urlparse, urlunparse
@@ -35,6 +36,15 @@ GATEWAY_OPERATOR_SCOPES = (
     "operator.approvals",
     "operator.pairing",
 )
+# Hot-path JSON helpers: bound once so frame encode/decode skips the module
+# attribute lookup, and compact separators keep outbound frames smaller.
+_json_loads = json.loads
+
+
+def _encode_frame(message: dict[str, Any]) -> str:
+    return json.dumps(message, separators=(",", ":"))
+
+
 DEFAULT_GATEWAY_CLIENT_ID = "gateway-client"
 DEFAULT_GATEWAY_CLIENT_MODE = "backend"
 CONTROL_UI_CLIENT_ID = "openclaw-control-ui"
@@ -43,7 +53,7 @@ GatewayConnectMode = Literal["device", "control_ui"]
 
 # NOTE: These are the base gateway methods from the OpenClaw gateway repo.
 # The gateway can expose additional methods at runtime via channel plugins.
-GATEWAY_METHODS = [
+GATEWAY_METHODS = (
     "health",
     "logs.tail",
     "channels.status",
@@ -130,9 +140,9 @@ GATEWAY_METHODS = [
     "chat.history",
     "chat.abort",
     "chat.send",
-]
+)
 
-GATEWAY_EVENTS = [
+GATEWAY_EVENTS = (
     "connect.challenge",
     "agent",
     "chat",
@@ -151,7 +161,7 @@ GATEWAY_EVENTS = [
     "voicewake.changed",
     "exec.approval.requested",
     "exec.approval.resolved",
-]
+)
 
 GATEWAY_METHODS_SET = frozenset(GATEWAY_METHODS)
 GATEWAY_EVENTS_SET = frozenset(GATEWAY_EVENTS)
@@ -176,12 +186,13 @@ class GatewayConfig:
     disable_device_pairing: bool = False
 
 
-def _build_gateway_url(config: GatewayConfig) -> str:
-    base_url: str = (config.url or "").strip()
+# URL assembly and redaction are pure string work on a handful of distinct
+# configs per process, so memoize them off the per-call path.
+@lru_cache(maxsize=8)
+def _build_gateway_url_cached(base_url: str, token: str | None) -> str:
     if not base_url:
         message = "Gateway URL is not configured."
         raise OpenClawGatewayError(message)
-    token = config.token
     if not token:
         return base_url
     parsed = urlparse(base_url)
@@ -189,6 +200,11 @@ def _build_gateway_url(config: GatewayConfig) -> str:
     return str(urlunparse(parsed._replace(query=query)))
 
 
+def _build_gateway_url(config: GatewayConfig) -> str:
+    return _build_gateway_url_cached((config.url or "").strip(), config.token)
+
+
+@lru_cache(maxsize=8)
 def _redacted_url_for_log(raw_url: str) -> str:
     parsed = urlparse(raw_url)
     return str(urlunparse(parsed._replace(query="", fragment="")))
@@ -278,7 +294,7 @@ async def _await_response(
 ) -> object:
     while True:
         raw = await ws.recv()
-        data = json.loads(raw)
+        data = _json_loads(raw)
         logger.log(
             TRACE_LEVEL,
             "gateway.rpc.recv request_id=%s type=%s",
@@ -319,7 +335,7 @@ async def _send_request(
         request_id,
         sorted((params or {}).keys()),
     )
-    await ws.send(json.dumps(message))
+    await ws.send(_encode_frame(message))
     return await _await_response(ws, request_id)
 
 
@@ -365,9 +381,8 @@ async def _ensure_connected(
 ) -> object:
     connect_nonce: str | None = None
     if first_message:
-        if isinstance(first_message, bytes):
-            first_message = first_message.decode("utf-8")
-        data = json.loads(first_message)
+        # json.loads accepts bytes directly; no need to decode first.
+        data = _json_loads(first_message)
         if data.get("type") == "event" and data.get("event") == "connect.challenge":
             payload = data.get("payload")
             if isinstance(payload, dict):
@@ -387,7 +402,7 @@ async def _ensure_connected(
         "method": "connect",
         "params": _build_connect_params(config, connect_nonce=connect_nonce),
     }
-    await ws.send(json.dumps(response))
+    await ws.send(_encode_frame(response))
     return await _await_response(ws, connect_id)
 
 
@@ -400,22 +415,169 @@ async def _recv_first_message_or_none(
         return None
 
 
-async def _openclaw_call_once(
-    method: str,
-    params: dict[str, Any] | None,
-    *,
-    config: GatewayConfig,
-    gateway_url: str,
-) -> object:
-    origin = _build_control_ui_origin(gateway_url) if config.disable_device_pairing else None
-    ssl_context = _create_ssl_context(config)
-    connect_kwargs: dict[str, Any] = {"ping_interval": None}
-    if origin is not None:
-        connect_kwargs["origin"] = origin
-    async with websockets.connect(gateway_url, ssl=ssl_context, **connect_kwargs) as ws:
-        first_message = await _recv_first_message_or_none(ws)
-        await _ensure_connected(ws, first_message, config)
-        return await _send_request(ws, method, params)
+def _result_from_frame(data: dict[str, Any]) -> object:
+    """Extract the RPC result from a matched response frame."""
+    if data.get("type") == "res":
+        ok = data.get("ok")
+        if ok is not None and not ok:
+            error = data.get("error", {}).get("message", "Gateway error")
+            raise OpenClawGatewayError(error)
+        return data.get("payload")
+    if data.get("error"):
+        message = data["error"].get("message", "Gateway error")
+        raise OpenClawGatewayError(message)
+    return data.get("result")
+
+
+class _GatewayConnection:
+    """A persistent, handshake-completed websocket to one gateway.
+
+    Reusing the connection across RPCs skips the connect + TLS + challenge
+    handshake that previously ran once per call. A background reader task
+    parses each incoming frame once and dispatches it to the pending request
+    future with the matching id, so concurrent RPCs can share the connection
+    instead of each discarding the others' frames. A stale keep-alive socket
+    is rebuilt once before giving up.
+    """
+
+    def __init__(self, config: GatewayConfig, gateway_url: str) -> None:
+        self._config = config
+        self._gateway_url = gateway_url
+        self._ws: websockets.ClientConnection | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def _open(self) -> websockets.ClientConnection:
+        config = self._config
+        origin = (
+            _build_control_ui_origin(self._gateway_url) if config.disable_device_pairing else None
+        )
+        ssl_context = _create_ssl_context(config)
+        connect_kwargs: dict[str, Any] = {"ping_interval": 20}
+        if origin is not None:
+            connect_kwargs["origin"] = origin
+        ws = await websockets.connect(self._gateway_url, ssl=ssl_context, **connect_kwargs)
+        try:
+            first_message = await _recv_first_message_or_none(ws)
+            await _ensure_connected(ws, first_message, config)
+        except BaseException:
+            await ws.close()
+            raise
+        self._ws = ws
+        self._reader = asyncio.create_task(self._read_frames(ws))
+        return ws
+
+    async def _read_frames(self, ws: websockets.ClientConnection) -> None:
+        try:
+            async for raw in ws:
+                data = _json_loads(raw)
+                frame_id = data.get("id")
+                future = self._pending.pop(frame_id, None) if frame_id is not None else None
+                if future is not None and not future.done():
+                    future.set_result(data)
+                    continue
+                # Unsolicited frame (gateway event or late response).
+                logger.log(
+                    TRACE_LEVEL,
+                    "gateway.rpc.recv.unmatched type=%s event=%s",
+                    data.get("type"),
+                    data.get("event"),
+                )
+        finally:
+            # Only the reader for the live socket may fail pending requests;
+            # a late-cancelled reader from a replaced connection must not
+            # clobber futures registered on its successor.
+            if self._ws is ws:
+                self._ws = None
+                self._fail_pending(ConnectionError("gateway connection closed"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _ensure_open(self) -> websockets.ClientConnection:
+        ws = self._ws
+        if ws is not None:
+            return ws
+        async with self._lock:
+            if self._ws is None:
+                await self._open()
+            assert self._ws is not None
+            return self._ws
+
+    async def close(self) -> None:
+        reader, self._reader = self._reader, None
+        ws, self._ws = self._ws, None
+        if reader is not None:
+            reader.cancel()
+        if ws is not None:
+            await ws.close()
+        self._fail_pending(ConnectionError("gateway connection closed"))
+
+    async def request(self, method: str, params: dict[str, Any] | None) -> object:
+        ws = await self._ensure_open()
+        request_id = str(uuid4())
+        message = {
+            "type": "req",
+            "id": request_id,
+            "method": method,
+            "params": params or {},
+        }
+        logger.log(
+            TRACE_LEVEL,
+            "gateway.rpc.send method=%s request_id=%s params_keys=%s",
+            method,
+            request_id,
+            sorted((params or {}).keys()),
+        )
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending[request_id] = future
+        try:
+            try:
+                await ws.send(_encode_frame(message))
+            except (ConnectionError, OSError, WebSocketException):
+                # The pooled socket went stale between calls; rebuild once.
+                # Drop our own future first so close()'s _fail_pending cannot
+                # set an exception on it that nothing ever retrieves.
+                self._pending.pop(request_id, None)
+                async with self._lock:
+                    await self.close()
+                    ws = await self._open()
+                future = loop.create_future()
+                self._pending[request_id] = future
+                await ws.send(_encode_frame(message))
+            data = await future
+        finally:
+            self._pending.pop(request_id, None)
+        return _result_from_frame(data)
+
+
+_connections: dict[GatewayConfig, _GatewayConnection] = {}
+_connections_lock = asyncio.Lock()
+
+
+async def _get_connection(config: GatewayConfig, gateway_url: str) -> _GatewayConnection:
+    conn = _connections.get(config)
+    if conn is None:
+        async with _connections_lock:
+            conn = _connections.get(config)
+            if conn is None:
+                conn = _GatewayConnection(config, gateway_url)
+                _connections[config] = conn
+    return conn
+
+
+async def close_gateway_connections() -> None:
+    """Close all pooled gateway connections (application shutdown hook)."""
+    async with _connections_lock:
+        connections = list(_connections.values())
+        _connections.clear()
+    for connection in connections:
+        await connection.close()
 
 
 async def _openclaw_connect_metadata_once(
@@ -453,12 +615,8 @@ async def openclaw_call(
         config.disable_device_pairing,
     )
     try:
-        payload = await _openclaw_call_once(
-            method,
-            params,
-            config=config,
-            gateway_url=gateway_url,
-        )
+        connection = await _get_connection(config, gateway_url)
+        payload = await connection.request(method, params)
         logger.debug(
             "gateway.rpc.call.success method=%s duration_ms=%s",
             method,
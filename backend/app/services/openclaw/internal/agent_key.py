@@ -8,9 +8,13 @@ from uuid import uuid4
 from app.models.agents import Agent
 from app.services.openclaw.constants import _SESSION_KEY_PARTS_MIN
 
+# Compiled once: slugify runs per agent in provisioning flows, and re.sub
+# with a literal pattern pays a regex-cache lookup on every call.
+_SLUG_STRIP = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_STRIP.sub("-", value.lower()).strip("-")
     return slug or uuid4().hex
 
 
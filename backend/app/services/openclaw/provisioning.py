@@ -257,11 +257,11 @@ def _select_role_soul_ref(
 
     prefix_matches = [ref for ref in refs if ref.slug.lower().startswith(f"{role_slug}-")]
     if prefix_matches:
-        return sorted(prefix_matches, key=lambda ref: len(ref.slug))[0]
+        return min(prefix_matches, key=lambda ref: len(ref.slug))
 
     contains_matches = [ref for ref in refs if role_slug in ref.slug.lower()]
     if contains_matches:
-        return sorted(contains_matches, key=lambda ref: len(ref.slug))[0]
+        return min(contains_matches, key=lambda ref: len(ref.slug))
 
     role_tokens = [token for token in role_slug.split("-") if token]
     if len(role_tokens) < 2:
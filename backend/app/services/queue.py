@@ -18,6 +18,10 @@ logger = get_logger(__name__)
 _SCHEDULED_SUFFIX = ":scheduled"
 _DRY_RUN_BATCH_SIZE = 100
 
+# Cache clients by URL so repeated queue operations reuse one connection
+# pool instead of opening a new TCP connection per enqueue/dequeue.
+_CLIENTS: dict[str, redis.Redis] = {}
+
 
 @dataclass(frozen=True)
 class QueuedTask:
@@ -41,7 +45,17 @@ class QueuedTask:
 
 
 def _redis_client(redis_url: str | None = None) -> redis.Redis:
-    return redis.Redis.from_url(redis_url or settings.rq_redis_url)
+    url = redis_url or settings.rq_redis_url
+    client = _CLIENTS.get(url)
+    if client is None:
+        client = redis.Redis.from_url(
+            url,
+            socket_connect_timeout=2,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        _CLIENTS[url] = client
+    return client
 
 
 def _scheduled_queue_name(queue_name: str) -> str:
@@ -14,11 +14,14 @@ SOULS_DIRECTORY_BASE_URL: Final[str] = "https://souls.directory"
 SOULS_DIRECTORY_SITEMAP_URL: Final[str] = f"{SOULS_DIRECTORY_BASE_URL}/sitemap.xml"
 
 _SITEMAP_TTL_SECONDS: Final[int] = 60 * 60
-_SOUL_URL_MIN_PARTS: Final[int] = 6
 _LOC_PATTERN: Final[re.Pattern[str]] = re.compile(
     r"<(?:[A-Za-z0-9_]+:)?loc>(.*?)</(?:[A-Za-z0-9_]+:)?loc>",
     flags=re.IGNORECASE | re.DOTALL,
 )
+# Expected: https://souls.directory/souls/{handle}/{slug}
+_SOUL_URL_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"^{re.escape(SOULS_DIRECTORY_BASE_URL)}/souls/([^/]+)/([^/]+)"
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -42,18 +45,14 @@ class SoulRef:
 def _parse_sitemap_soul_refs(sitemap_xml: str) -> list[SoulRef]:
     """Parse sitemap XML and extract valid souls.directory handle/slug refs."""
     # Extract <loc> values without XML entity expansion.
-    urls = [unescape(match.group(1)).strip() for match in _LOC_PATTERN.finditer(sitemap_xml)]
-
     refs: list[SoulRef] = []
-    for url in urls:
-        if not url.startswith(f"{SOULS_DIRECTORY_BASE_URL}/souls/"):
-            continue
-        # Expected: https://souls.directory/souls/{handle}/{slug}
-        parts = url.split("/")
-        if len(parts) < _SOUL_URL_MIN_PARTS:
+    for loc_match in _LOC_PATTERN.finditer(sitemap_xml):
+        url = unescape(loc_match.group(1)).strip()
+        soul_match = _SOUL_URL_PATTERN.match(url)
+        if soul_match is None:
             continue
-        handle = parts[4].strip()
-        slug = parts[5].strip()
+        handle = soul_match.group(1).strip()
+        slug = soul_match.group(2).strip()
         if not handle or not slug:
             continue
         refs.append(SoulRef(handle=handle, slug=slug))
@@ -65,6 +64,29 @@ _sitemap_cache: dict[str, object] = {
     "refs": [],
 }
 
+# Shared keep-alive client so repeated souls.directory calls reuse one pooled
+# connection instead of paying a TCP+TLS handshake per request.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            headers={"User-Agent": "openclaw-mission-control/1.0"},
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared souls.directory client (application shutdown hook)."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
 
 async def list_souls_directory_refs(
     *,
@@ -78,22 +100,14 @@ async def list_souls_directory_refs(
     if cached and isinstance(cached, list) and now - loaded_at < _SITEMAP_TTL_SECONDS:
         return cached
 
-    owns_client = client is None
     if client is None:
-        client = httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0),
-            headers={"User-Agent": "openclaw-mission-control/1.0"},
-        )
-    try:
-        resp = await client.get(SOULS_DIRECTORY_SITEMAP_URL)
-        resp.raise_for_status()
-        refs = _parse_sitemap_soul_refs(resp.text)
-        _sitemap_cache["loaded_at"] = now
-        _sitemap_cache["refs"] = refs
-        return refs
-    finally:
-        if owns_client:
-            await client.aclose()
+        client = _get_shared_client()
+    resp = await client.get(SOULS_DIRECTORY_SITEMAP_URL)
+    resp.raise_for_status()
+    refs = _parse_sitemap_soul_refs(resp.text)
+    _sitemap_cache["loaded_at"] = now
+    _sitemap_cache["refs"] = refs
+    return refs
 
 
 async def fetch_soul_markdown(
@@ -109,19 +123,11 @@ async def fetch_soul_markdown(
         normalized_slug = normalized_slug[: -len(".md")]
     url = f"{SOULS_DIRECTORY_BASE_URL}/api/souls/" f"{normalized_handle}/{normalized_slug}.md"
 
-    owns_client = client is None
     if client is None:
-        client = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0, connect=5.0),
-            headers={"User-Agent": "openclaw-mission-control/1.0"},
-        )
-    try:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
-    finally:
-        if owns_client:
-            await client.aclose()
+        client = _get_shared_client()
+    resp = await client.get(url)
+    resp.raise_for_status()
+    return resp.text
 
 
 def search_souls(refs: list[SoulRef], *, query: str, limit: int = 20) -> list[SoulRef]:
@@ -108,25 +108,19 @@ async def blocked_by_for_task(
     return blocked_by_dependency_ids(dependency_ids=dep_ids, status_by_id=status_by_id)
 
 
-def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
-    """Detect cycles in a directed dependency graph."""
+def _reaches(start_ids: Sequence[UUID], target: UUID, edges: Mapping[UUID, set[UUID]]) -> bool:
+    """Return whether target is reachable from any start node in the graph."""
+    stack = list(start_ids)
     visited: set[UUID] = set()
-    in_stack: set[UUID] = set()
-
-    def dfs(current: UUID) -> bool:
-        if current in in_stack:
+    while stack:
+        current = stack.pop()
+        if current == target:
             return True
         if current in visited:
-            return False
+            continue
         visited.add(current)
-        in_stack.add(current)
-        for nxt in edges.get(current, set()):
-            if dfs(nxt):
-                return True
-        in_stack.remove(current)
-        return False
-
-    return any(dfs(start_node) for start_node in nodes)
+        stack.extend(edges.get(current, ()))
+    return False
 
 
 async def validate_dependency_update(
@@ -164,13 +158,11 @@ async def validate_dependency_update(
             },
         )
 
-    # Rebuild the board-wide graph and overlay the pending edit for this task so
-    # validation catches indirect cycles created through existing edges.
-    task_ids = list(
-        await session.exec(
-            select(col(Task.id)).where(col(Task.board_id) == board_id),
-        ),
-    )
+    # Rebuild the board-wide graph and overlay the pending edit for this task.
+    # Every edit passes through this validator, so the stored graph is acyclic
+    # and any new cycle must route through task_id; checking whether task_id is
+    # reachable from the proposed dependencies covers indirect cycles without
+    # walking the whole board.
     rows = list(
         await session.exec(
             select(
@@ -184,7 +176,7 @@ async def validate_dependency_update(
         edges[src].add(dst)
     edges[task_id] = set(normalized)
 
-    if _has_cycle(task_ids, edges):
+    if _reaches(normalized, task_id, edges):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Dependency cycle detected. Remove the cycle before saving.",
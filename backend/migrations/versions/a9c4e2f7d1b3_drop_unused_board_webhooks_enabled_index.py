@@ -0,0 +1,36 @@
+"""Drop unused board_webhooks.enabled index.
+
+Revision ID: a9c4e2f7d1b3
+Revises: e7a3d5c1f9b4
+Create Date: 2026-08-29 00:10:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a9c4e2f7d1b3"
+down_revision = "e7a3d5c1f9b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop the boolean enabled index.
+
+    Webhooks are always fetched by id or board_id and the enabled flag is
+    checked on the loaded row, so the btree on enabled never serves a query
+    and only adds write amplification.
+    """
+    inspector = sa.inspect(op.get_bind())
+    index_names = {item["name"] for item in inspector.get_indexes("board_webhooks")}
+    if "ix_board_webhooks_enabled" in index_names:
+        op.drop_index("ix_board_webhooks_enabled", table_name="board_webhooks")
+
+
+def downgrade() -> None:
+    """Recreate the enabled index."""
+    op.create_index("ix_board_webhooks_enabled", "board_webhooks", ["enabled"])
@@ -20,36 +20,37 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "boards",
-        sa.Column(
-            "require_approval_for_done",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.true(),
-        ),
-    )
-    op.add_column(
-        "boards",
-        sa.Column(
-            "require_review_before_done",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.false(),
-        ),
-    )
-    op.add_column(
-        "boards",
-        sa.Column(
-            "block_status_changes_with_pending_approval",
-            sa.Boolean(),
-            nullable=False,
-            server_default=sa.false(),
-        ),
-    )
+    # Batched so SQLite does one table rebuild instead of three and other
+    # dialects take one ALTER TABLE lock for all three columns.
+    with op.batch_alter_table("boards") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "require_approval_for_done",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.true(),
+            ),
+        )
+        batch_op.add_column(
+            sa.Column(
+                "require_review_before_done",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.false(),
+            ),
+        )
+        batch_op.add_column(
+            sa.Column(
+                "block_status_changes_with_pending_approval",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.false(),
+            ),
+        )
 
 
 def downgrade() -> None:
-    op.drop_column("boards", "block_status_changes_with_pending_approval")
-    op.drop_column("boards", "require_review_before_done")
-    op.drop_column("boards", "require_approval_for_done")
+    with op.batch_alter_table("boards") as batch_op:
+        batch_op.drop_column("block_status_changes_with_pending_approval")
+        batch_op.drop_column("require_review_before_done")
+        batch_op.drop_column("require_approval_for_done")
@@ -0,0 +1,62 @@
+"""Drop redundant single-column custom field indexes.
+
+Revision ID: e7a3d5c1f9b4
+Revises: b497b348ebb4
+Create Date: 2026-08-29 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7a3d5c1f9b4"
+down_revision = "b497b348ebb4"
+branch_labels = None
+depends_on = None
+
+
+def _index_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+    return {item["name"] for item in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Drop single-column indexes covered by unique composite btrees.
+
+    The unique constraints on (task_id, definition_id) and
+    (board_id, definition_id) already provide btrees whose leftmost prefix
+    serves task_id/board_id lookups, so the single-column indexes only add
+    write amplification.
+    """
+    inspector = sa.inspect(op.get_bind())
+
+    if "ix_task_custom_field_values_task_id" in _index_names(
+        inspector, "task_custom_field_values"
+    ):
+        op.drop_index(
+            "ix_task_custom_field_values_task_id",
+            table_name="task_custom_field_values",
+        )
+    if "ix_board_task_custom_fields_board_id" in _index_names(
+        inspector, "board_task_custom_fields"
+    ):
+        op.drop_index(
+            "ix_board_task_custom_fields_board_id",
+            table_name="board_task_custom_fields",
+        )
+
+
+def downgrade() -> None:
+    """Recreate the single-column task_id/board_id indexes."""
+    op.create_index(
+        "ix_board_task_custom_fields_board_id",
+        "board_task_custom_fields",
+        ["board_id"],
+    )
+    op.create_index(
+        "ix_task_custom_field_values_task_id",
+        "task_custom_field_values",
+        ["task_id"],
+    )
@@ -27,7 +27,11 @@ def upgrade() -> None:
     bind = op.get_bind()
     inspector = sa.inspect(bind)
 
-    if not inspector.has_table("board_webhooks"):
+    # A table created by this migration has no secondary indexes yet, so
+    # only pre-existing tables need a reflection round-trip for index names.
+    if inspector.has_table("board_webhooks"):
+        webhook_indexes = _index_names(inspector, "board_webhooks")
+    else:
         op.create_table(
             "board_webhooks",
             sa.Column("id", sa.Uuid(), nullable=False),
@@ -39,15 +43,16 @@ def upgrade() -> None:
             sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
             sa.PrimaryKeyConstraint("id"),
         )
+        webhook_indexes = set()
 
-    inspector = sa.inspect(bind)
-    webhook_indexes = _index_names(inspector, "board_webhooks")
     if "ix_board_webhooks_board_id" not in webhook_indexes:
         op.create_index("ix_board_webhooks_board_id", "board_webhooks", ["board_id"])
     if "ix_board_webhooks_enabled" not in webhook_indexes:
         op.create_index("ix_board_webhooks_enabled", "board_webhooks", ["enabled"])
 
-    if not inspector.has_table("board_webhook_payloads"):
+    if inspector.has_table("board_webhook_payloads"):
+        payload_indexes = _index_names(inspector, "board_webhook_payloads")
+    else:
         op.create_table(
             "board_webhook_payloads",
             sa.Column("id", sa.Uuid(), nullable=False),
@@ -62,9 +67,8 @@ def upgrade() -> None:
             sa.ForeignKeyConstraint(["webhook_id"], ["board_webhooks.id"]),
             sa.PrimaryKeyConstraint("id"),
         )
+        payload_indexes = set()
 
-    inspector = sa.inspect(bind)
-    payload_indexes = _index_names(inspector, "board_webhook_payloads")
     if "ix_board_webhook_payloads_board_id" not in payload_indexes:
         op.create_index(
             "ix_board_webhook_payloads_board_id",
@@ -91,40 +95,51 @@ def upgrade() -> None:
         )
 
 
+def _drop_indexes(
+    bind: sa.Connection,
+    inspector: sa.Inspector,
+    table_name: str,
+    index_names: tuple[str, ...],
+) -> None:
+    """Drop indexes, batching into one statement where the dialect allows."""
+    if bind.dialect.name == "postgresql":
+        # One DROP INDEX with IF EXISTS replaces per-index reflection checks
+        # and statements with a single catalog round-trip.
+        op.execute(f"DROP INDEX IF EXISTS {', '.join(index_names)}")
+        return
+    existing = _index_names(inspector, table_name)
+    for index_name in index_names:
+        if index_name in existing:
+            op.drop_index(index_name, table_name=table_name)
+
+
 def downgrade() -> None:
     """Drop board webhook and payload capture tables."""
     bind = op.get_bind()
     inspector = sa.inspect(bind)
 
     if inspector.has_table("board_webhook_payloads"):
-        payload_indexes = _index_names(inspector, "board_webhook_payloads")
-        if "ix_board_webhook_payloads_board_webhook_received_at" in payload_indexes:
-            op.drop_index(
+        _drop_indexes(
+            bind,
+            inspector,
+            "board_webhook_payloads",
+            (
                 "ix_board_webhook_payloads_board_webhook_received_at",
-                table_name="board_webhook_payloads",
-            )
-        if "ix_board_webhook_payloads_received_at" in payload_indexes:
-            op.drop_index(
                 "ix_board_webhook_payloads_received_at",
-                table_name="board_webhook_payloads",
-            )
-        if "ix_board_webhook_payloads_webhook_id" in payload_indexes:
-            op.drop_index(
                 "ix_board_webhook_payloads_webhook_id",
-                table_name="board_webhook_payloads",
-            )
-        if "ix_board_webhook_payloads_board_id" in payload_indexes:
-            op.drop_index(
                 "ix_board_webhook_payloads_board_id",
-                table_name="board_webhook_payloads",
-            )
+            ),
+        )
         op.drop_table("board_webhook_payloads")
 
-    inspector = sa.inspect(bind)
     if inspector.has_table("board_webhooks"):
-        webhook_indexes = _index_names(inspector, "board_webhooks")
-        if "ix_board_webhooks_enabled" in webhook_indexes:
-            op.drop_index("ix_board_webhooks_enabled", table_name="board_webhooks")
-        if "ix_board_webhooks_board_id" in webhook_indexes:
-            op.drop_index("ix_board_webhooks_board_id", table_name="board_webhooks")
+        _drop_indexes(
+            bind,
+            inspector,
+            "board_webhooks",
+            (
+                "ix_board_webhooks_enabled",
+                "ix_board_webhooks_board_id",
+            ),
+        )
         op.drop_table("board_webhooks")
@@ -50,26 +50,38 @@ def main() -> int:
             print(f"  - {h}")
         return 1
 
+    # Version files are named <revision>_<slug>.py, so the directory listing
+    # enumerates every revision on disk — including orphans that the graph
+    # walk below can never reach.
+    all_revisions: set[str] = {
+        path.stem.split("_", 1)[0]
+        for path in Path(script.versions).glob("*.py")
+        if path.stem != "__init__"
+    }
+
     try:
+        # One iterative walk down the public down-revision/dependency edges
+        # replaces the walk_revisions() generator, which materializes every
+        # step twice, and avoids reading revision_map._revision_map directly.
         reachable: set[str] = set()
-        for walk_rev in script.walk_revisions(base="base", head="heads"):
-            if walk_rev is None:
+        stack: list[str] = list(heads)
+        while stack:
+            revision = stack.pop()
+            if revision in reachable:
+                continue
+            rev = script.get_revision(revision)
+            if rev is None:
                 continue
-            if walk_rev.revision:
-                reachable.add(walk_rev.revision)
+            reachable.add(revision)
+            for edges in (rev.down_revision, rev.dependencies):
+                if isinstance(edges, str):
+                    stack.append(edges)
+                elif edges:
+                    stack.extend(edges)
     except Exception as exc:  # pragma: no cover - CI path
         print(f"ERROR: failed while walking Alembic revision graph: {exc}")
         return 1
 
-    all_revisions: set[str] = set()
-    # Alembic's revision_map is dynamically typed; guard None values.
-    for map_rev in script.revision_map._revision_map.values():
-        if map_rev is None:
-            continue
-        revision = getattr(map_rev, "revision", None)
-        if revision:
-            all_revisions.add(revision)
-
     orphans = sorted(all_revisions - reachable)
     if orphans:
         print("ERROR: orphan Alembic revisions detected (not reachable from heads):")
@@ -3,7 +3,11 @@
 
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -13,3 +17,17 @@ if str(ROOT) not in sys.path:
 # defaults during import-time settings initialization, regardless of shell env.
 os.environ["AUTH_MODE"] = "local"
 os.environ["LOCAL_AUTH_TOKEN"] = "test-local-token-0123456789-0123456789-0123456789x"
+
+
+@pytest.fixture
+def fake_async_session() -> Callable[..., AsyncMock]:
+    """Factory for AsyncSession doubles whose exec() resolves to a canned result."""
+
+    def _make(exec_result: object = None) -> AsyncMock:
+        session = AsyncMock()
+        session.exec = AsyncMock(return_value=[] if exec_result is None else exec_result)
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        return session
+
+    return _make
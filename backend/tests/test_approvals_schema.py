@@ -38,36 +38,45 @@ def test_approval_create_requires_lead_reasoning() -> None:
         )
 
 
-def test_approval_create_accepts_nested_decision_reason() -> None:
-    model = ApprovalCreate.model_validate(
-        {
-            "action_type": "task.update",
-            "confidence": 80,
-            "payload": {"decision": {"reason": "Needs manual approval."}},
-        },
-    )
-    assert model.payload == {"decision": {"reason": "Needs manual approval."}}
-
-
-def test_approval_create_accepts_float_confidence() -> None:
-    model = ApprovalCreate.model_validate(
-        {
-            "action_type": "task.update",
-            "confidence": 88.75,
-            "payload": {"reason": "Fractional confidence should be preserved."},
-        },
-    )
-    assert model.confidence == 88.75
-
-
-def test_approval_create_accepts_top_level_lead_reasoning() -> None:
-    model = ApprovalCreate.model_validate(
-        {
-            "action_type": "task.update",
-            "confidence": 80,
-            "lead_reasoning": "Need manual review before changing task status.",
-        },
-    )
-    assert model.payload == {
-        "reason": "Need manual review before changing task status.",
-    }
+@pytest.mark.parametrize(
+    ("data", "field", "expected"),
+    [
+        pytest.param(
+            {
+                "action_type": "task.update",
+                "confidence": 80,
+                "payload": {"decision": {"reason": "Needs manual approval."}},
+            },
+            "payload",
+            {"decision": {"reason": "Needs manual approval."}},
+            id="nested-decision-reason",
+        ),
+        pytest.param(
+            {
+                "action_type": "task.update",
+                "confidence": 88.75,
+                "payload": {"reason": "Fractional confidence should be preserved."},
+            },
+            "confidence",
+            88.75,
+            id="float-confidence",
+        ),
+        pytest.param(
+            {
+                "action_type": "task.update",
+                "confidence": 80,
+                "lead_reasoning": "Need manual review before changing task status.",
+            },
+            "payload",
+            {"reason": "Need manual review before changing task status."},
+            id="top-level-lead-reasoning",
+        ),
+    ],
+)
+def test_approval_create_accepts_valid_payloads(
+    data: dict[str, object],
+    field: str,
+    expected: object,
+) -> None:
+    model = ApprovalCreate.model_validate(data)
+    assert getattr(model, field) == expected
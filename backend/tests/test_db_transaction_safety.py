@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
@@ -21,45 +20,24 @@ class _Thing(SQLModel, table=True):
     name: str
 
 
-@dataclass
-class _SessionCtx:
-    session: Any
-    entered: int = 0
-    exited: int = 0
+class _CommitError(SQLAlchemyError):
+    pass
 
-    async def __aenter__(self) -> Any:
-        self.entered += 1
-        return self.session
 
-    async def __aexit__(self, _exc_type: Any, _exc: Any, _tb: Any) -> bool:
-        self.exited += 1
-        return False
-
-
-@dataclass
-class _Maker:
-    ctx: _SessionCtx
-
-    def __call__(self) -> _SessionCtx:
-        return self.ctx
+def _session_maker_returning(session: AsyncMock) -> tuple[MagicMock, MagicMock]:
+    """Build a session maker whose async context manager yields `session`."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=ctx), ctx
 
 
 @pytest.mark.asyncio
 async def test_get_session_rolls_back_on_dependency_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    @dataclass
-    class _FakeDependencySession:
-        rollbacks: int = 0
-
-        @staticmethod
-        def in_transaction() -> bool:
-            return True
-
-        async def rollback(self) -> None:
-            self.rollbacks += 1
-
-    fake_session = _FakeDependencySession()
-    ctx = _SessionCtx(fake_session)
-    monkeypatch.setattr(db_session, "async_session_maker", _Maker(ctx))
+    fake_session = AsyncMock()
+    fake_session.in_transaction = MagicMock(return_value=True)
+    maker, ctx = _session_maker_returning(fake_session)
+    monkeypatch.setattr(db_session, "async_session_maker", maker)
 
     generator = db_session.get_session()
     yielded = await generator.__anext__()
@@ -68,77 +46,64 @@ async def test_get_session_rolls_back_on_dependency_error(monkeypatch: pytest.Mo
     with pytest.raises(RuntimeError, match="boom"):
         await generator.athrow(RuntimeError("boom"))
 
-    assert fake_session.rollbacks == 1
-    assert ctx.entered == 1
-    assert ctx.exited == 1
+    assert fake_session.rollback.await_count == 1
+    assert ctx.__aenter__.await_count == 1
+    assert ctx.__aexit__.await_count == 1
 
 
 @pytest.mark.asyncio
 async def test_create_rolls_back_when_commit_fails() -> None:
-    class _CommitError(SQLAlchemyError):
-        pass
-
-    @dataclass
-    class _FailCommitSession:
-        rollback_calls: int = 0
-        added: list[Any] = None
-
-        def __post_init__(self) -> None:
-            if self.added is None:
-                self.added = []
-
-        def add(self, value: Any) -> None:
-            self.added.append(value)
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.commit = AsyncMock(side_effect=_CommitError("commit failed"))
 
-        @staticmethod
-        async def flush() -> None:
-            return None
-
-        @staticmethod
-        async def commit() -> None:
-            raise _CommitError("commit failed")
+    with pytest.raises(SQLAlchemyError, match="commit failed"):
+        await crud.create(session, _Thing, name="demo")
 
-        async def rollback(self) -> None:
-            self.rollback_calls += 1
+    assert session.rollback.await_count == 1
+    assert session.add.call_count == 1
 
-        @staticmethod
-        async def refresh(_value: Any) -> None:
-            return None
 
-    session = _FailCommitSession()
+@pytest.mark.asyncio
+async def test_create_many_rolls_back_when_commit_fails() -> None:
+    session = AsyncMock()
+    session.exec = AsyncMock(return_value=SimpleNamespace(rowcount=2))
+    session.commit = AsyncMock(side_effect=_CommitError("commit failed"))
 
+    rows = [{"name": "a"}, {"name": "b"}]
     with pytest.raises(SQLAlchemyError, match="commit failed"):
-        await crud.create(session, _Thing, name="demo")
+        await crud.create_many(session, _Thing, rows)
 
-    assert session.rollback_calls == 1
-    assert len(session.added) == 1
+    assert session.exec.await_count == 1
+    assert session.exec.await_args.kwargs["params"] == rows
+    assert session.rollback.await_count == 1
 
 
 @pytest.mark.asyncio
-async def test_delete_where_rolls_back_when_commit_fails() -> None:
-    class _CommitError(SQLAlchemyError):
-        pass
-
-    @dataclass
-    class _FailCommitDmlSession:
-        rollback_calls: int = 0
-        exec_calls: int = 0
+async def test_create_many_batches_rows_and_commits_once() -> None:
+    session = AsyncMock()
+    session.exec = AsyncMock(return_value=SimpleNamespace(rowcount=2))
 
-        async def exec(self, _statement: Any) -> Any:
-            self.exec_calls += 1
-            return SimpleNamespace(rowcount=3)
+    inserted = await crud.create_many(
+        session,
+        _Thing,
+        [{"name": str(i)} for i in range(5)],
+        batch_size=2,
+    )
 
-        @staticmethod
-        async def commit() -> None:
-            raise _CommitError("commit failed")
+    assert inserted == 5
+    assert session.exec.await_count == 3
+    assert session.commit.await_count == 1
 
-        async def rollback(self) -> None:
-            self.rollback_calls += 1
 
-    session = _FailCommitDmlSession()
+@pytest.mark.asyncio
+async def test_delete_where_rolls_back_when_commit_fails() -> None:
+    session = AsyncMock()
+    session.exec = AsyncMock(return_value=SimpleNamespace(rowcount=3))
+    session.commit = AsyncMock(side_effect=_CommitError("commit failed"))
 
     with pytest.raises(SQLAlchemyError, match="commit failed"):
         await crud.delete_where(session, _Thing, commit=True)
 
-    assert session.exec_calls == 1
-    assert session.rollback_calls == 1
+    assert session.exec.await_count == 1
+    assert session.rollback.await_count == 1
@@ -24,7 +24,21 @@ from app.core.error_handling import (
 )
 
 
-def test_request_validation_error_includes_request_id():
+@pytest.fixture(scope="module")
+def client():
+    """One shared app + client for all route-level cases in this module.
+
+    Building a fresh FastAPI app and TestClient per test costs several
+    milliseconds of ASGI setup each; the handlers below are stateless, so
+    every test can hit its own path on a single shared instance.
+    """
+
+    class Payload(BaseModel):
+        content: str
+
+    class Out(BaseModel):
+        name: str = Field(min_length=1)
+
     app = FastAPI()
     install_error_handling(app)
 
@@ -32,7 +46,26 @@ def test_request_validation_error_includes_request_id():
     def needs_int(limit: int) -> dict[str, int]:
         return {"limit": limit}
 
-    client = TestClient(app)
+    @app.put("/needs-object")
+    def needs_object(payload: Payload) -> dict[str, str]:
+        return {"content": payload.content}
+
+    @app.get("/nope")
+    def nope() -> None:
+        raise HTTPException(status_code=404, detail="nope")
+
+    @app.get("/boom")
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/bad", response_model=Out)
+    def bad() -> dict[str, str]:
+        return {"name": ""}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_request_validation_error_includes_request_id(client):
     resp = client.get("/needs-int?limit=abc")
 
     assert resp.status_code == 422
@@ -42,18 +75,7 @@ def test_request_validation_error_includes_request_id():
     assert resp.headers.get(REQUEST_ID_HEADER) == body["request_id"]
 
 
-def test_request_validation_error_handles_bytes_input_without_500():
-    class Payload(BaseModel):
-        content: str
-
-    app = FastAPI()
-    install_error_handling(app)
-
-    @app.put("/needs-object")
-    def needs_object(payload: Payload) -> dict[str, str]:
-        return {"content": payload.content}
-
-    client = TestClient(app, raise_server_exceptions=False)
+def test_request_validation_error_handles_bytes_input_without_500(client):
     resp = client.put(
         "/needs-object",
         content=b"plain-text-body",
@@ -67,15 +89,7 @@ def test_request_validation_error_handles_bytes_input_without_500():
     assert resp.headers.get(REQUEST_ID_HEADER) == body["request_id"]
 
 
-def test_http_exception_includes_request_id():
-    app = FastAPI()
-    install_error_handling(app)
-
-    @app.get("/nope")
-    def nope() -> None:
-        raise HTTPException(status_code=404, detail="nope")
-
-    client = TestClient(app)
+def test_http_exception_includes_request_id(client):
     resp = client.get("/nope")
 
     assert resp.status_code == 404
@@ -85,15 +99,7 @@ def test_http_exception_includes_request_id():
     assert resp.headers.get(REQUEST_ID_HEADER) == body["request_id"]
 
 
-def test_unhandled_exception_returns_500_with_request_id():
-    app = FastAPI()
-    install_error_handling(app)
-
-    @app.get("/boom")
-    def boom() -> None:
-        raise RuntimeError("boom")
-
-    client = TestClient(app, raise_server_exceptions=False)
+def test_unhandled_exception_returns_500_with_request_id(client):
     resp = client.get("/boom")
 
     assert resp.status_code == 500
@@ -103,18 +109,7 @@ def test_unhandled_exception_returns_500_with_request_id():
     assert resp.headers.get(REQUEST_ID_HEADER) == body["request_id"]
 
 
-def test_response_validation_error_returns_500_with_request_id():
-    class Out(BaseModel):
-        name: str = Field(min_length=1)
-
-    app = FastAPI()
-    install_error_handling(app)
-
-    @app.get("/bad", response_model=Out)
-    def bad() -> dict[str, str]:
-        return {"name": ""}
-
-    client = TestClient(app, raise_server_exceptions=False)
+def test_response_validation_error_returns_500_with_request_id(client):
     resp = client.get("/bad")
 
     assert resp.status_code == 500
@@ -124,15 +119,7 @@ def test_response_validation_error_returns_500_with_request_id():
     assert resp.headers.get(REQUEST_ID_HEADER) == body["request_id"]
 
 
-def test_client_provided_request_id_is_preserved():
-    app = FastAPI()
-    install_error_handling(app)
-
-    @app.get("/needs-int")
-    def needs_int(limit: int) -> dict[str, int]:
-        return {"limit": limit}
-
-    client = TestClient(app)
+def test_client_provided_request_id_is_preserved(client):
     resp = client.get("/needs-int?limit=abc", headers={REQUEST_ID_HEADER: "  req-123  "})
 
     assert resp.status_code == 422
@@ -142,6 +129,8 @@ def test_client_provided_request_id_is_preserved():
 
 
 def test_slow_request_emits_slow_log(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Needs its own app: RequestIdMiddleware snapshots request_log_slow_ms at
+    # install time, so the settings monkeypatch must happen before setup.
     warnings: list[tuple[str, dict[str, object]]] = []
 
     def _fake_warning(message: str, *args: object, **kwargs: object) -> None:
@@ -178,6 +167,8 @@ def test_slow_request_emits_slow_log(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_health_route_skips_request_logs_when_disabled(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    # Needs its own app: RequestIdMiddleware snapshots
+    # request_log_include_health at install time.
     monkeypatch.setattr(error_handling.settings, "request_log_include_health", False)
 
     app = FastAPI()
@@ -148,19 +148,25 @@ async def test_openclaw_call_uses_single_connect_attempt(
 ) -> None:
     call_count = 0
 
-    async def _fake_call_once(
-        method: str,
-        params: dict[str, object] | None,
-        *,
+    class _FakeConnection:
+        async def request(
+            self,
+            method: str,
+            params: dict[str, object] | None,
+        ) -> object:
+            nonlocal call_count
+            del method, params
+            call_count += 1
+            return {"ok": True}
+
+    async def _fake_get_connection(
         config: GatewayConfig,
         gateway_url: str,
-    ) -> object:
-        nonlocal call_count
-        del method, params, config, gateway_url
-        call_count += 1
-        return {"ok": True}
+    ) -> _FakeConnection:
+        del config, gateway_url
+        return _FakeConnection()
 
-    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _fake_call_once)
+    monkeypatch.setattr(gateway_rpc, "_get_connection", _fake_get_connection)
 
     payload = await openclaw_call(
         "status",
@@ -175,17 +181,23 @@ async def test_openclaw_call_uses_single_connect_attempt(
 async def test_openclaw_call_surfaces_scope_error_without_device_fallback(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    async def _fake_call_once(
-        method: str,
-        params: dict[str, object] | None,
-        *,
+    class _FakeConnection:
+        async def request(
+            self,
+            method: str,
+            params: dict[str, object] | None,
+        ) -> object:
+            del method, params
+            raise OpenClawGatewayError("missing scope: operator.read")
+
+    async def _fake_get_connection(
         config: GatewayConfig,
         gateway_url: str,
-    ) -> object:
-        del method, params, config, gateway_url
-        raise OpenClawGatewayError("missing scope: operator.read")
+    ) -> _FakeConnection:
+        del config, gateway_url
+        return _FakeConnection()
 
-    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _fake_call_once)
+    monkeypatch.setattr(gateway_rpc, "_get_connection", _fake_get_connection)
 
     with pytest.raises(OpenClawGatewayError, match="missing scope: operator.read"):
         await openclaw_call(
@@ -0,0 +1,219 @@
+"""Tests for the pooled gateway RPC connection (_GatewayConnection)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import pytest
+
+from app.services.openclaw.gateway_rpc import (
+    GatewayConfig,
+    OpenClawGatewayError,
+    _GatewayConnection,
+)
+
+_Responder = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+
+class _FakeWebSocket:
+    """Scripted in-memory stand-in for websockets.ClientConnection.
+
+    Frames sent through ``send`` are recorded and optionally answered via the
+    responder; ``feed``/``close`` drive the async iterator the reader task
+    consumes.
+    """
+
+    def __init__(self, responder: _Responder | None = None, send_errors: int = 0) -> None:
+        self.sent_frames: list[dict[str, Any]] = []
+        self.closed = False
+        self._incoming: asyncio.Queue[str | None] = asyncio.Queue()
+        self._responder = responder
+        self._send_errors_left = send_errors
+
+    async def send(self, frame: str) -> None:
+        if self._send_errors_left > 0:
+            self._send_errors_left -= 1
+            raise ConnectionError("stale socket")
+        message = json.loads(frame)
+        self.sent_frames.append(message)
+        if self._responder is not None:
+            reply = self._responder(message)
+            if reply is not None:
+                self.feed(reply)
+
+    def feed(self, frame: dict[str, Any]) -> None:
+        self._incoming.put_nowait(json.dumps(frame))
+
+    async def close(self) -> None:
+        self.closed = True
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self) -> _FakeWebSocket:
+        return self
+
+    async def __anext__(self) -> str:
+        raw = await self._incoming.get()
+        if raw is None:
+            raise StopAsyncIteration
+        return raw
+
+
+def _connection_with_fakes(
+    monkeypatch: pytest.MonkeyPatch,
+    make_ws: Callable[[], _FakeWebSocket],
+) -> tuple[_GatewayConnection, list[_FakeWebSocket], list[asyncio.Task[None]]]:
+    """Build a connection whose _open installs a fake socket and reader."""
+    config = GatewayConfig(url="ws://gateway.example/ws")
+    conn = _GatewayConnection(config, "ws://gateway.example/ws")
+    opened: list[_FakeWebSocket] = []
+    readers: list[asyncio.Task[None]] = []
+
+    async def _fake_open() -> _FakeWebSocket:
+        ws = make_ws()
+        opened.append(ws)
+        conn._ws = ws  # type: ignore[assignment]
+        conn._reader = asyncio.create_task(conn._read_frames(ws))  # type: ignore[arg-type]
+        readers.append(conn._reader)
+        return ws
+
+    monkeypatch.setattr(conn, "_open", _fake_open)
+    return conn, opened, readers
+
+
+def _ok_responder(message: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "res",
+        "id": message["id"],
+        "ok": True,
+        "payload": {"method": message["method"]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_request_round_trip_reuses_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn, opened, _ = _connection_with_fakes(
+        monkeypatch,
+        lambda: _FakeWebSocket(responder=_ok_responder),
+    )
+
+    first = await conn.request("status", None)
+    second = await conn.request("health", {"probe": True})
+
+    assert first == {"method": "status"}
+    assert second == {"method": "health"}
+    assert len(opened) == 1
+    assert [frame["method"] for frame in opened[0].sent_frames] == ["status", "health"]
+    assert opened[0].sent_frames[1]["params"] == {"probe": True}
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_request_raises_on_error_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _error_responder(message: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "res",
+            "id": message["id"],
+            "ok": False,
+            "error": {"message": "boom"},
+        }
+
+    conn, _, _ = _connection_with_fakes(
+        monkeypatch,
+        lambda: _FakeWebSocket(responder=_error_responder),
+    )
+
+    with pytest.raises(OpenClawGatewayError, match="boom"):
+        await conn.request("status", None)
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_request_rebuilds_connection_once_on_send_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sockets_made = 0
+
+    def _make_ws() -> _FakeWebSocket:
+        nonlocal sockets_made
+        sockets_made += 1
+        # First pooled socket is stale: its send raises immediately.
+        return _FakeWebSocket(responder=_ok_responder, send_errors=1 if sockets_made == 1 else 0)
+
+    conn, opened, _ = _connection_with_fakes(monkeypatch, _make_ws)
+
+    # The rebuild path must unregister its own future before close(), or the
+    # ConnectionError set by _fail_pending is never retrieved.
+    failed_futures: list[asyncio.Future[dict[str, Any]]] = []
+    original_fail_pending = conn._fail_pending
+
+    def _recording_fail_pending(exc: Exception) -> None:
+        failed_futures.extend(conn._pending.values())
+        original_fail_pending(exc)
+
+    monkeypatch.setattr(conn, "_fail_pending", _recording_fail_pending)
+
+    payload = await conn.request("status", None)
+
+    assert payload == {"method": "status"}
+    assert failed_futures == []
+    assert len(opened) == 2
+    assert opened[0].closed
+    assert opened[0].sent_frames == []
+    assert [frame["method"] for frame in opened[1].sent_frames] == ["status"]
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_in_flight_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Responder never answers, so the request stays pending until close().
+    conn, _, _ = _connection_with_fakes(monkeypatch, lambda: _FakeWebSocket(responder=None))
+
+    request_task = asyncio.create_task(conn.request("status", None))
+    await asyncio.sleep(0)
+    await conn.close()
+
+    with pytest.raises(ConnectionError, match="gateway connection closed"):
+        await request_task
+
+
+@pytest.mark.asyncio
+async def test_peer_close_fails_in_flight_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn, opened, _ = _connection_with_fakes(monkeypatch, lambda: _FakeWebSocket(responder=None))
+
+    request_task = asyncio.create_task(conn.request("status", None))
+    await asyncio.sleep(0)
+    # The gateway drops the socket: the reader ends and fails the pending future.
+    await opened[0].close()
+
+    with pytest.raises(ConnectionError, match="gateway connection closed"):
+        await request_task
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_replaced_reader_does_not_fail_new_pending(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn, opened, readers = _connection_with_fakes(
+        monkeypatch,
+        lambda: _FakeWebSocket(responder=None),
+    )
+
+    await conn._open()
+    await conn._open()  # replaces the socket; the first reader is now stale
+
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    conn._pending["req-1"] = future
+
+    # Let the stale reader finish: it must not touch the live connection's
+    # pending map.
+    await opened[0].close()
+    await readers[0]
+
+    assert not future.done()
+    assert conn._ws is opened[1]
+    await conn.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
@@ -8,33 +10,32 @@ from fastapi import HTTPException
 
 from app.api import metrics as metrics_api
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-class _FakeSession:
-    def __init__(self, exec_result: list[object]) -> None:
-        self._exec_result = exec_result
 
-    async def exec(self, _statement: object) -> list[object]:
-        return self._exec_result
+def _patch_accessible(
+    monkeypatch: pytest.MonkeyPatch,
+    boards: list[object],
+) -> AsyncMock:
+    """Stub list_accessible_board_ids to resolve to the given board ids."""
+    mock = AsyncMock(return_value=list(boards))
+    monkeypatch.setattr(metrics_api, "list_accessible_board_ids", mock)
+    return mock
 
 
 @pytest.mark.asyncio
 async def test_resolve_dashboard_board_ids_returns_requested_board(
     monkeypatch: pytest.MonkeyPatch,
+    fake_async_session: Callable[..., AsyncMock],
 ) -> None:
     board_id = uuid4()
 
-    async def _accessible(*_args: object, **_kwargs: object) -> list[object]:
-        return [board_id]
-
-    monkeypatch.setattr(
-        metrics_api,
-        "list_accessible_board_ids",
-        _accessible,
-    )
+    _patch_accessible(monkeypatch, [board_id])
     ctx = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
 
     resolved = await metrics_api._resolve_dashboard_board_ids(
-        _FakeSession([]),
+        fake_async_session([]),
         ctx=ctx,
         board_id=board_id,
         group_id=None,
@@ -46,23 +47,17 @@ async def test_resolve_dashboard_board_ids_returns_requested_board(
 @pytest.mark.asyncio
 async def test_resolve_dashboard_board_ids_rejects_inaccessible_board(
     monkeypatch: pytest.MonkeyPatch,
+    fake_async_session: Callable[..., AsyncMock],
 ) -> None:
     accessible_board_id = uuid4()
     requested_board_id = uuid4()
 
-    async def _accessible(*_args: object, **_kwargs: object) -> list[object]:
-        return [accessible_board_id]
-
-    monkeypatch.setattr(
-        metrics_api,
-        "list_accessible_board_ids",
-        _accessible,
-    )
+    _patch_accessible(monkeypatch, [accessible_board_id])
     ctx = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
 
     with pytest.raises(HTTPException) as exc_info:
         await metrics_api._resolve_dashboard_board_ids(
-            _FakeSession([]),
+            fake_async_session([]),
             ctx=ctx,
             board_id=requested_board_id,
             group_id=None,
@@ -74,21 +69,15 @@ async def test_resolve_dashboard_board_ids_rejects_inaccessible_board(
 @pytest.mark.asyncio
 async def test_resolve_dashboard_board_ids_filters_by_group(
     monkeypatch: pytest.MonkeyPatch,
+    fake_async_session: Callable[..., AsyncMock],
 ) -> None:
     board_a = uuid4()
     board_b = uuid4()
     group_id = uuid4()
 
-    async def _accessible(*_args: object, **_kwargs: object) -> list[object]:
-        return [board_a, board_b]
-
-    monkeypatch.setattr(
-        metrics_api,
-        "list_accessible_board_ids",
-        _accessible,
-    )
+    _patch_accessible(monkeypatch, [board_a, board_b])
     ctx = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
-    session = _FakeSession([board_b])
+    session = fake_async_session([board_b])
 
     resolved = await metrics_api._resolve_dashboard_board_ids(
         session,
@@ -103,20 +92,14 @@ async def test_resolve_dashboard_board_ids_filters_by_group(
 @pytest.mark.asyncio
 async def test_resolve_dashboard_board_ids_returns_empty_when_board_not_in_group(
     monkeypatch: pytest.MonkeyPatch,
+    fake_async_session: Callable[..., AsyncMock],
 ) -> None:
     board_id = uuid4()
     group_id = uuid4()
 
-    async def _accessible(*_args: object, **_kwargs: object) -> list[object]:
-        return [board_id]
-
-    monkeypatch.setattr(
-        metrics_api,
-        "list_accessible_board_ids",
-        _accessible,
-    )
+    _patch_accessible(monkeypatch, [board_id])
     ctx = SimpleNamespace(member=SimpleNamespace(organization_id=uuid4()))
-    session = _FakeSession([])
+    session = fake_async_session([])
 
     resolved = await metrics_api._resolve_dashboard_board_ids(
         session,
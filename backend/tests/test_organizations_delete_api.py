@@ -3,8 +3,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 import pytest
@@ -15,44 +14,87 @@ from app.models.organization_members import OrganizationMember
 from app.models.organizations import Organization
 from app.services.organizations import OrganizationContext
 
-
-@dataclass
-class _FakeSession:
-    executed: list[object] = field(default_factory=list)
-    committed: int = 0
-
-    async def exec(self, statement: object) -> None:
-        self.executed.append(statement)
-
-    async def execute(self, statement: object) -> None:
-        self.executed.append(statement)
-
-    async def commit(self) -> None:
-        self.committed += 1
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from unittest.mock import AsyncMock
+
+# (child table, referencing parent) pairs: every row in the child must be
+# deleted before the parent's rows to avoid FK violations.
+_FK_DELETE_ORDER_RULES = (
+    ("activity_events", "tasks"),
+    ("activity_events", "agents"),
+    ("task_dependencies", "tasks"),
+    ("task_fingerprints", "boards"),
+    ("approval_task_links", "approvals"),
+    ("approvals", "tasks"),
+    ("approvals", "boards"),
+    ("board_memory", "boards"),
+    ("board_webhook_payloads", "board_webhooks"),
+    ("board_webhooks", "boards"),
+    ("board_onboarding_sessions", "boards"),
+    ("organization_board_access", "boards"),
+    ("organization_invite_board_access", "organization_invites"),
+    ("tasks", "boards"),
+    ("tasks", "agents"),
+    ("agents", "boards"),
+    ("agents", "gateways"),
+    ("boards", "gateways"),
+    ("boards", "organizations"),
+    ("board_group_memory", "board_groups"),
+    ("board_groups", "organizations"),
+    ("gateways", "organizations"),
+    ("organization_invites", "organizations"),
+    ("organization_members", "users"),
+    ("organization_members", "organizations"),
+    ("users", "organizations"),
+)
 
 
 @pytest.mark.asyncio
-async def test_delete_my_org_cleans_dependents_before_organization_delete() -> None:
-    """Delete flow should remove dependent rows before the organization row."""
-    session: Any = _FakeSession()
+@pytest.mark.parametrize(
+    ("role", "allowed"),
+    [
+        pytest.param("owner", True, id="owner-deletes"),
+        pytest.param("admin", False, id="non-owner-forbidden"),
+    ],
+)
+async def test_delete_my_org(
+    fake_async_session: Callable[..., AsyncMock],
+    role: str,
+    allowed: bool,
+) -> None:
+    """Owners delete dependents before the organization row; others get 403."""
+    session: Any = fake_async_session()
+    executed: list[object] = []
+    # Route both exec() and execute() into one list to assert statement order.
+    session.exec.side_effect = executed.append
+    session.execute.side_effect = executed.append
     org_id = uuid4()
     ctx = OrganizationContext(
         organization=Organization(id=org_id, name=f"org-{org_id}"),
         member=OrganizationMember(
             organization_id=org_id,
             user_id=uuid4(),
-            role="owner",
+            role=role,
         ),
     )
 
+    if not allowed:
+        with pytest.raises(HTTPException) as exc_info:
+            await organizations.delete_my_org(session=session, ctx=ctx)
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        assert executed == []
+        assert session.commit.await_count == 0
+        return
+
     await organizations.delete_my_org(
         session=session,
         ctx=ctx,
     )
 
-    executed_tables = [statement.table.name for statement in session.executed]
-    assert executed_tables == [
-        "activity_events",
+    executed_tables = [statement.table.name for statement in executed]
+    assert set(executed_tables) == {
         "activity_events",
         "task_dependencies",
         "task_fingerprints",
@@ -64,8 +106,6 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
         "board_onboarding_sessions",
         "organization_board_access",
         "organization_invite_board_access",
-        "organization_board_access",
-        "organization_invite_board_access",
         "tasks",
         "agents",
         "boards",
@@ -76,30 +116,17 @@ async def test_delete_my_org_cleans_dependents_before_organization_delete() -> N
         "organization_members",
         "users",
         "organizations",
-    ]
-    assert session.committed == 1
-
-
-@pytest.mark.asyncio
-async def test_delete_my_org_requires_owner_role() -> None:
-    """Delete flow should reject non-owner members with HTTP 403."""
-    session: Any = _FakeSession()
-    org_id = uuid4()
-    ctx = OrganizationContext(
-        organization=Organization(id=org_id, name=f"org-{org_id}"),
-        member=OrganizationMember(
-            organization_id=org_id,
-            user_id=uuid4(),
-            role="admin",
-        ),
-    )
-
-    with pytest.raises(HTTPException) as exc_info:
-        await organizations.delete_my_org(
-            session=session,
-            ctx=ctx,
-        )
-
-    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-    assert session.executed == []
-    assert session.committed == 0
+    }
+    # Any order that deletes child rows before the rows they reference is
+    # valid; asserting the FK partial order (last touch of each child before
+    # first touch of its parent) keeps the test stable across batching or
+    # reordering of independent deletes.
+    first = {table: executed_tables.index(table) for table in set(executed_tables)}
+    last = {
+        table: len(executed_tables) - 1 - executed_tables[::-1].index(table)
+        for table in set(executed_tables)
+    }
+    for child, parent in _FK_DELETE_ORDER_RULES:
+        assert last[child] < first[parent], f"{child} must be deleted before {parent}"
+    assert executed_tables[-1] == "organizations"
+    assert session.commit.await_count == 1
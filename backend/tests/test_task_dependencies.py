@@ -37,30 +37,33 @@ def test_blocked_by_dependency_ids_flags_not_done_and_missing_status():
 
 
 @pytest.mark.parametrize(
-    ("nodes", "edges", "expected"),
+    ("start_ids", "target", "edges", "expected"),
     [
-        # A -> B -> C (acyclic)
+        # B -> C cannot get back to A (acyclic)
         (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
+            [UUID(int=2)],
+            UUID(int=1),
             {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}},
             False,
         ),
-        # A -> B -> C -> A (cycle)
+        # B -> C -> A closes the loop back to A
         (
-            [UUID(int=1), UUID(int=2), UUID(int=3)],
+            [UUID(int=2)],
+            UUID(int=1),
             {UUID(int=1): {UUID(int=2)}, UUID(int=2): {UUID(int=3)}, UUID(int=3): {UUID(int=1)}},
             True,
         ),
-        # Self-loop (cycle)
+        # Self-loop
         (
             [UUID(int=1)],
+            UUID(int=1),
             {UUID(int=1): {UUID(int=1)}},
             True,
         ),
     ],
 )
-def test_has_cycle(nodes, edges, expected):
-    assert task_dependencies._has_cycle(nodes, edges) is expected
+def test_reaches(start_ids, target, edges, expected):
+    assert task_dependencies._reaches(start_ids, target, edges) is expected
 
 
 @dataclass
@@ -244,13 +247,10 @@ async def test_validate_dependency_update_rejects_cycles(monkeypatch):
     # existing_ids contains dependency
     existing_ids = {task_b}
 
-    # task_ids list on board
-    all_task_ids = [task_a, task_b]
-
     # existing edges: B depends on A, then set A depends on B => cycle
     existing_edges = [(task_b, task_a)]
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids, existing_edges])
 
     with pytest.raises(task_dependencies.HTTPException) as exc:
         await task_dependencies.validate_dependency_update(
@@ -271,10 +271,9 @@ async def test_validate_dependency_update_returns_deduped_ids_when_ok():
     dep2 = uuid4()
 
     existing_ids = {dep1, dep2}
-    all_task_ids = [task_id, dep1, dep2]
     existing_edges: list[tuple[UUID, UUID]] = []
 
-    session = _FakeSession(exec_results=[existing_ids, all_task_ids, existing_edges])
+    session = _FakeSession(exec_results=[existing_ids, existing_edges])
 
     normalized = await task_dependencies.validate_dependency_update(
         session,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -20,16 +22,37 @@ from app.models.organizations import Organization
 from app.models.tasks import Task
 from app.schemas.tasks import TaskRead, TaskUpdate
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
-async def _make_engine() -> AsyncEngine:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def engine() -> AsyncIterator[AsyncEngine]:
+    # One schema-creation pass for the whole module; tests isolate via the
+    # rolled-back outer transaction in the session fixture below. StaticPool
+    # pins a single connection so every checkout sees the same in-memory db.
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
     async with engine.connect() as conn, conn.begin():
         await conn.run_sync(SQLModel.metadata.create_all)
-    return engine
+    yield engine
+    await engine.dispose()
 
 
-async def _make_session(engine: AsyncEngine) -> AsyncSession:
-    return AsyncSession(engine, expire_on_commit=False)
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        async with AsyncSession(
+            conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await outer.rollback()
 
 
 async def _seed_board_task_and_agent(
@@ -77,11 +100,15 @@ async def _seed_board_task_and_agent(
         assigned_agent_id=agent.id,
     )
 
-    session.add(Organization(id=organization_id, name=f"org-{organization_id}"))
-    session.add(gateway)
-    session.add(board)
-    session.add(task)
-    session.add(agent)
+    session.add_all(
+        [
+            Organization(id=organization_id, name=f"org-{organization_id}"),
+            gateway,
+            board,
+            task,
+            agent,
+        ],
+    )
     await session.commit()
     return board, task, agent
 
@@ -115,418 +142,330 @@ async def _update_task_status(
     )
 
 
-@pytest.mark.asyncio
-async def test_update_task_rejects_done_without_approved_linked_approval() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(session)
-            session.add(
-                Approval(
-                    id=uuid4(),
-                    board_id=board.id,
-                    task_id=task.id,
-                    action_type="task.review",
-                    confidence=65,
-                    status="pending",
-                ),
-            )
-            await session.commit()
-
-            with pytest.raises(HTTPException) as exc:
-                await _update_task_to_done(session, task=task, agent=agent)
-
-            assert exc.value.status_code == 409
-            detail = exc.value.detail
-            assert isinstance(detail, dict)
-            assert detail["message"] == (
-                "Task can only be marked done when a linked approval has been approved."
-            )
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_done_with_approved_primary_task_approval() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(session)
-            session.add(
-                Approval(
-                    id=uuid4(),
-                    board_id=board.id,
-                    task_id=task.id,
-                    action_type="task.review",
-                    confidence=92,
-                    status="approved",
-                ),
-            )
-            await session.commit()
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="done"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=agent),
-            )
-
-            assert updated.status == "done"
-            assert updated.assigned_agent_id == agent.id
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_done_with_approved_multi_task_link() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(session)
-            primary_task_id = uuid4()
-            session.add(Task(id=primary_task_id, board_id=board.id, title="Primary"))
-
-            approval_id = uuid4()
-            session.add(
-                Approval(
-                    id=approval_id,
-                    board_id=board.id,
-                    task_id=primary_task_id,
-                    action_type="task.batch_review",
-                    confidence=88,
-                    status="approved",
-                ),
-            )
-            await session.commit()
-
-            session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task.id))
-            await session.commit()
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="done"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=agent),
-            )
-
-            assert updated.status == "done"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_done_without_approval_when_board_toggle_disabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, agent = await _seed_board_task_and_agent(
-                session,
-                require_approval_for_done=False,
-            )
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="done"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=agent),
-            )
-
-            assert updated.status == "done"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_rejects_done_from_in_progress_when_review_toggle_enabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="in_progress",
-                require_approval_for_done=False,
-                require_review_before_done=True,
-            )
-
-            with pytest.raises(HTTPException) as exc:
-                await _update_task_to_done(session, task=task, agent=agent)
-
-            assert exc.value.status_code == 409
-            detail = exc.value.detail
-            assert isinstance(detail, dict)
-            assert detail["message"] == (
-                "Task can only be marked done from review when the board rule is enabled."
-            )
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_done_from_review_when_review_toggle_enabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="review",
-                require_approval_for_done=False,
-                require_review_before_done=True,
-            )
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="done"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=agent),
-            )
-
-            assert updated.status == "done"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_rejects_status_change_with_pending_approval_when_toggle_enabled() -> (
-    None
-):
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="inbox",
-                require_approval_for_done=False,
-                block_status_changes_with_pending_approval=True,
-            )
-            session.add(
-                Approval(
-                    id=uuid4(),
-                    board_id=board.id,
-                    task_id=task.id,
-                    action_type="task.execute",
-                    confidence=70,
-                    status="pending",
-                ),
-            )
-            await session.commit()
-
-            with pytest.raises(HTTPException) as exc:
-                await _update_task_status(
-                    session,
-                    task=task,
-                    agent=agent,
-                    status="in_progress",
-                )
-
-            assert exc.value.status_code == 409
-            detail = exc.value.detail
-            assert isinstance(detail, dict)
-            assert detail["message"] == (
-                "Task status cannot be changed while a linked approval is pending."
-            )
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_status_change_with_pending_approval_when_toggle_disabled() -> (
-    None
-):
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="inbox",
-                require_approval_for_done=False,
-                block_status_changes_with_pending_approval=False,
-            )
-            session.add(
-                Approval(
-                    id=uuid4(),
-                    board_id=board.id,
-                    task_id=task.id,
-                    action_type="task.execute",
-                    confidence=70,
-                    status="pending",
-                ),
-            )
-            await session.commit()
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="in_progress"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=agent),
-            )
-
-            assert updated.status == "in_progress"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_rejects_non_lead_status_change_when_only_lead_rule_enabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="inbox",
-                require_approval_for_done=False,
-                only_lead_can_change_status=True,
-            )
-
-            with pytest.raises(HTTPException) as exc:
-                await _update_task_status(
-                    session,
-                    task=task,
-                    agent=agent,
-                    status="in_progress",
-                )
-
-            assert exc.value.status_code == 403
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_non_lead_status_change_when_only_lead_rule_disabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="inbox",
-                require_approval_for_done=False,
-                only_lead_can_change_status=False,
-            )
-
-            updated = await _update_task_status(
-                session,
-                task=task,
-                agent=agent,
-                status="in_progress",
-            )
-
-            assert updated.status == "in_progress"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_lead_can_still_change_status_when_only_lead_rule_enabled() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            _board, task, lead_agent = await _seed_board_task_and_agent(
-                session,
-                task_status="review",
-                require_approval_for_done=False,
-                require_review_before_done=False,
-                only_lead_can_change_status=True,
-                agent_is_board_lead=True,
-            )
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(status="inbox"),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="agent", agent=lead_agent),
-            )
-
-            assert updated.status == "inbox"
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_allows_dependency_change_with_pending_approval() -> None:
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, _agent = await _seed_board_task_and_agent(
-                session,
-                task_status="review",
-                require_approval_for_done=False,
-                block_status_changes_with_pending_approval=True,
-            )
-            dependency = Task(
+async def test_update_task_rejects_done_without_approved_linked_approval(
+    session: AsyncSession,
+) -> None:
+    board, task, agent = await _seed_board_task_and_agent(session)
+    session.add(
+        Approval(
+            id=uuid4(),
+            board_id=board.id,
+            task_id=task.id,
+            action_type="task.review",
+            confidence=65,
+            status="pending",
+        ),
+    )
+    await session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await _update_task_to_done(session, task=task, agent=agent)
+
+    assert exc.value.status_code == 409
+    detail = exc.value.detail
+    assert isinstance(detail, dict)
+    assert detail["message"] == (
+        "Task can only be marked done when a linked approval has been approved."
+    )
+
+
+async def test_update_task_allows_done_with_approved_primary_task_approval(
+    session: AsyncSession,
+) -> None:
+    board, task, agent = await _seed_board_task_and_agent(session)
+    session.add(
+        Approval(
+            id=uuid4(),
+            board_id=board.id,
+            task_id=task.id,
+            action_type="task.review",
+            confidence=92,
+            status="approved",
+        ),
+    )
+    await session.commit()
+
+    updated = await tasks_api.update_task(
+        payload=TaskUpdate(status="done"),
+        task=task,
+        session=session,
+        actor=ActorContext(actor_type="agent", agent=agent),
+    )
+
+    assert updated.status == "done"
+    assert updated.assigned_agent_id == agent.id
+
+
+async def test_update_task_allows_done_with_approved_multi_task_link(
+    session: AsyncSession,
+) -> None:
+    board, task, agent = await _seed_board_task_and_agent(session)
+    primary_task_id = uuid4()
+    approval_id = uuid4()
+    session.add_all(
+        [
+            Task(id=primary_task_id, board_id=board.id, title="Primary"),
+            Approval(
+                id=approval_id,
+                board_id=board.id,
+                task_id=primary_task_id,
+                action_type="task.batch_review",
+                confidence=88,
+                status="approved",
+            ),
+        ],
+    )
+    # Flush makes the approval row visible for the link FK without paying a
+    # second commit.
+    await session.flush()
+    session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task.id))
+    await session.commit()
+
+    updated = await tasks_api.update_task(
+        payload=TaskUpdate(status="done"),
+        task=task,
+        session=session,
+        actor=ActorContext(actor_type="agent", agent=agent),
+    )
+
+    assert updated.status == "done"
+
+
+async def test_update_task_allows_done_without_approval_when_board_toggle_disabled(
+    session: AsyncSession,
+) -> None:
+    _board, task, agent = await _seed_board_task_and_agent(
+        session,
+        require_approval_for_done=False,
+    )
+
+    updated = await tasks_api.update_task(
+        payload=TaskUpdate(status="done"),
+        task=task,
+        session=session,
+        actor=ActorContext(actor_type="agent", agent=agent),
+    )
+
+    assert updated.status == "done"
+
+
+@pytest.mark.parametrize(
+    ("task_status", "allowed"),
+    [
+        pytest.param("in_progress", False, id="from-in-progress-rejected"),
+        pytest.param("review", True, id="from-review-allowed"),
+    ],
+)
+async def test_update_task_done_with_review_toggle_enabled(
+    session: AsyncSession,
+    task_status: str,
+    allowed: bool,
+) -> None:
+    _board, task, agent = await _seed_board_task_and_agent(
+        session,
+        task_status=task_status,
+        require_approval_for_done=False,
+        require_review_before_done=True,
+    )
+
+    if allowed:
+        updated = await _update_task_status(session, task=task, agent=agent, status="done")
+        assert updated.status == "done"
+        return
+
+    with pytest.raises(HTTPException) as exc:
+        await _update_task_to_done(session, task=task, agent=agent)
+
+    assert exc.value.status_code == 409
+    detail = exc.value.detail
+    assert isinstance(detail, dict)
+    assert detail["message"] == (
+        "Task can only be marked done from review when the board rule is enabled."
+    )
+
+
+@pytest.mark.parametrize(
+    ("block_toggle", "allowed"),
+    [
+        pytest.param(True, False, id="toggle-enabled-rejected"),
+        pytest.param(False, True, id="toggle-disabled-allowed"),
+    ],
+)
+async def test_update_task_status_change_with_pending_approval(
+    session: AsyncSession,
+    block_toggle: bool,
+    allowed: bool,
+) -> None:
+    board, task, agent = await _seed_board_task_and_agent(
+        session,
+        task_status="inbox",
+        require_approval_for_done=False,
+        block_status_changes_with_pending_approval=block_toggle,
+    )
+    session.add(
+        Approval(
+            id=uuid4(),
+            board_id=board.id,
+            task_id=task.id,
+            action_type="task.execute",
+            confidence=70,
+            status="pending",
+        ),
+    )
+    await session.commit()
+
+    if allowed:
+        updated = await _update_task_status(
+            session,
+            task=task,
+            agent=agent,
+            status="in_progress",
+        )
+        assert updated.status == "in_progress"
+        return
+
+    with pytest.raises(HTTPException) as exc:
+        await _update_task_status(
+            session,
+            task=task,
+            agent=agent,
+            status="in_progress",
+        )
+
+    assert exc.value.status_code == 409
+    detail = exc.value.detail
+    assert isinstance(detail, dict)
+    assert detail["message"] == (
+        "Task status cannot be changed while a linked approval is pending."
+    )
+
+
+@pytest.mark.parametrize(
+    ("only_lead_rule", "is_board_lead", "task_status", "target_status", "allowed"),
+    [
+        pytest.param(True, False, "inbox", "in_progress", False, id="non-lead-rejected"),
+        pytest.param(False, False, "inbox", "in_progress", True, id="rule-disabled-allowed"),
+        pytest.param(True, True, "review", "inbox", True, id="lead-allowed"),
+    ],
+)
+async def test_update_task_only_lead_can_change_status_rule(
+    session: AsyncSession,
+    only_lead_rule: bool,
+    is_board_lead: bool,
+    task_status: str,
+    target_status: Literal["inbox", "in_progress", "review", "done"],
+    allowed: bool,
+) -> None:
+    _board, task, agent = await _seed_board_task_and_agent(
+        session,
+        task_status=task_status,
+        require_approval_for_done=False,
+        only_lead_can_change_status=only_lead_rule,
+        agent_is_board_lead=is_board_lead,
+    )
+
+    if allowed:
+        updated = await _update_task_status(
+            session,
+            task=task,
+            agent=agent,
+            status=target_status,
+        )
+        assert updated.status == target_status
+        return
+
+    with pytest.raises(HTTPException) as exc:
+        await _update_task_status(
+            session,
+            task=task,
+            agent=agent,
+            status=target_status,
+        )
+
+    assert exc.value.status_code == 403
+
+
+async def test_update_task_allows_dependency_change_with_pending_approval(
+    session: AsyncSession,
+) -> None:
+    board, task, _agent = await _seed_board_task_and_agent(
+        session,
+        task_status="review",
+        require_approval_for_done=False,
+        block_status_changes_with_pending_approval=True,
+    )
+    dependency = Task(
+        id=uuid4(),
+        board_id=board.id,
+        title="Dependency",
+        status="inbox",
+    )
+    session.add_all(
+        [
+            dependency,
+            Approval(
                 id=uuid4(),
                 board_id=board.id,
-                title="Dependency",
-                status="inbox",
-            )
-            session.add(dependency)
-            session.add(
-                Approval(
-                    id=uuid4(),
-                    board_id=board.id,
-                    task_id=task.id,
-                    action_type="task.execute",
-                    confidence=70,
-                    status="pending",
-                ),
-            )
-            await session.commit()
-
-            updated = await tasks_api.update_task(
-                payload=TaskUpdate(
-                    status="review",
-                    depends_on_task_ids=[dependency.id],
-                ),
-                task=task,
-                session=session,
-                actor=ActorContext(actor_type="user"),
-            )
-
-            assert updated.depends_on_task_ids == [dependency.id]
-            assert updated.status == "inbox"
-            assert updated.blocked_by_task_ids == [dependency.id]
-    finally:
-        await engine.dispose()
-
-
-@pytest.mark.asyncio
-async def test_update_task_rejects_status_change_for_pending_multi_task_link_when_toggle_enabled() -> (
-    None
-):
-    engine = await _make_engine()
-    try:
-        async with await _make_session(engine) as session:
-            board, task, agent = await _seed_board_task_and_agent(
-                session,
-                task_status="inbox",
-                require_approval_for_done=False,
-                block_status_changes_with_pending_approval=True,
-            )
-            primary_task_id = uuid4()
-            session.add(Task(id=primary_task_id, board_id=board.id, title="Primary"))
-
-            approval_id = uuid4()
-            session.add(
-                Approval(
-                    id=approval_id,
-                    board_id=board.id,
-                    task_id=primary_task_id,
-                    action_type="task.batch_execute",
-                    confidence=73,
-                    status="pending",
-                ),
-            )
-            await session.commit()
-
-            session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task.id))
-            await session.commit()
-
-            with pytest.raises(HTTPException) as exc:
-                await _update_task_status(
-                    session,
-                    task=task,
-                    agent=agent,
-                    status="in_progress",
-                )
-
-            assert exc.value.status_code == 409
-    finally:
-        await engine.dispose()
+                task_id=task.id,
+                action_type="task.execute",
+                confidence=70,
+                status="pending",
+            ),
+        ],
+    )
+    await session.commit()
+
+    updated = await tasks_api.update_task(
+        payload=TaskUpdate(
+            status="review",
+            depends_on_task_ids=[dependency.id],
+        ),
+        task=task,
+        session=session,
+        actor=ActorContext(actor_type="user"),
+    )
+
+    assert updated.depends_on_task_ids == [dependency.id]
+    assert updated.status == "inbox"
+    assert updated.blocked_by_task_ids == [dependency.id]
+
+
+async def test_update_task_rejects_status_change_for_pending_multi_task_link_when_toggle_enabled(
+    session: AsyncSession,
+) -> None:
+    board, task, agent = await _seed_board_task_and_agent(
+        session,
+        task_status="inbox",
+        require_approval_for_done=False,
+        block_status_changes_with_pending_approval=True,
+    )
+    primary_task_id = uuid4()
+    approval_id = uuid4()
+    session.add_all(
+        [
+            Task(id=primary_task_id, board_id=board.id, title="Primary"),
+            Approval(
+                id=approval_id,
+                board_id=board.id,
+                task_id=primary_task_id,
+                action_type="task.batch_execute",
+                confidence=73,
+                status="pending",
+            ),
+        ],
+    )
+    # Flush makes the approval row visible for the link FK without paying a
+    # second commit.
+    await session.flush()
+    session.add(ApprovalTaskLink(approval_id=approval_id, task_id=task.id))
+    await session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await _update_task_status(
+            session,
+            task=task,
+            agent=agent,
+            status="in_progress",
+        )
+
+    assert exc.value.status_code == 409
@@ -16,12 +16,49 @@ Limitations:
 
 from __future__ import annotations
 
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
 
-LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+# Bytes pattern: the syntax characters are ASCII, so files are scanned raw and
+# only the matched targets (tens of bytes) pay UTF-8 decode cost.
+LINK_RE = re.compile(rb"\[[^\]]+\]\(([^)]+)\)")
+
+
+@lru_cache(maxsize=8192)
+def _exists(path: str) -> bool:
+    """Cached existence probe; many links point at the same few targets."""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=8192)
+def _isdir(path: str) -> bool:
+    """Cached directory probe for trailing-slash targets outside the index."""
+    return os.path.isdir(path)
+
+
+def _build_known_paths(root: Path) -> tuple[frozenset[str], frozenset[str]]:
+    """Index every file and directory under root with one tree walk.
+
+    One linear walk replaces a stat per link; lookups become set membership.
+    Returns (all paths, directories only) so trailing-slash links can insist
+    on a directory. Bulky non-doc trees are pruned — anything they would have
+    contributed is still covered by the stat fallbacks in `_check_file`.
+    """
+    skip = {".git", "node_modules", ".venv", "__pycache__"}
+    known: set[str] = set()
+    dirs: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in skip]
+        known.add(dirpath)
+        dirs.add(dirpath)
+        for name in filenames:
+            known.add(os.path.join(dirpath, name))
+    return frozenset(known), frozenset(dirs)
 
 
 def iter_md_files(root: Path) -> list[Path]:
@@ -46,52 +83,98 @@ def iter_md_files(root: Path) -> list[Path]:
     if docs.exists():
         files.extend(sorted(docs.rglob("*.md")))
 
-    # de-dupe + stable order
-    return sorted({p.resolve() for p in files})
+    # de-dupe preserving order: root entrypoints first, then docs/ in rglob's
+    # sorted order. Paths are all built from `root`, so plain equality is
+    # enough and we skip a resolve() (stat per component) per file.
+    return list(dict.fromkeys(files))
 
 
+@lru_cache(maxsize=2048)
 def normalize_target(raw: str) -> str | None:
-    raw = raw.strip()
-    if not raw:
-        return None
-    if raw.startswith("http://") or raw.startswith("https://") or raw.startswith("mailto:"):
+    # Most targets are already trimmed; only strip when an edge is whitespace.
+    if raw[:1].isspace() or raw[-1:].isspace():
+        raw = raw.strip()
+    if not raw or raw.startswith(("http://", "https://", "mailto:", "#")):
         return None
-    if raw.startswith("#"):
+    # Skip common markdown reference-style quirks (<./path.md> autolinks).
+    if raw[:1] == "<" and raw[-1:] == ">":
         return None
     # strip query/fragment
     raw = raw.split("#", 1)[0].split("?", 1)[0]
     if not raw:
         return None
-    return raw
+    # Interned: the same few targets repeat across files, and pointer-equal
+    # strings hit the identity fast path in later dict/set lookups.
+    return sys.intern(raw)
+
+
+def _check_file(
+    md: Path,
+    root: Path,
+    known: frozenset[str],
+    known_dirs: frozenset[str],
+) -> list[tuple[str, str]]:
+    """Scan one markdown file and return its broken relative links.
+
+    Entries are (path relative to root, raw link target), already stringified
+    so the report loop is plain printing.
+    """
+    missing: list[tuple[str, str]] = []
+    md_rel: str | None = None
+
+    # Local bindings keep the per-link loop on LOAD_FAST instead of repeated
+    # global/attribute lookups.
+    normalize = normalize_target
+    normpath = os.path.normpath
+    join = os.path.join
+    add_missing = missing.append
+
+    data = md.read_bytes()
+    # Link-free files skip the regex pass entirely; bytes.__contains__ runs a
+    # C-level substring search at near memory-bandwidth speed.
+    if b"](" not in data:
+        return missing
+    md_parent = str(md.parent)
+    for match in LINK_RE.findall(data):
+        target_raw = match.decode("utf-8", "replace")
+        target = normalize(target_raw)
+        if target is None:
+            continue
+
+        # Resolve relative to current file. normpath + a single exists()
+        # stat is enough; we don't need resolve()'s symlink walk.
+        candidate = normpath(join(md_parent, target))
+        if target.endswith("/"):
+            # A trailing slash promises a directory, not just any path.
+            ok = candidate in known_dirs or _isdir(candidate)
+        else:
+            ok = candidate in known or _exists(candidate)
+        if not ok:
+            if md_rel is None:
+                md_rel = str(md.relative_to(root))
+            add_missing((md_rel, target_raw))
+    return missing
 
 
 def main() -> int:
     root = Path(__file__).resolve().parents[1]
     md_files = iter_md_files(root)
+    known, known_dirs = _build_known_paths(root)
 
-    missing: list[tuple[Path, str]] = []
-
-    for md in md_files:
-        text = md.read_text(encoding="utf-8")
-        for m in LINK_RE.finditer(text):
-            target_raw = m.group(1)
-            target = normalize_target(target_raw)
-            if target is None:
-                continue
-
-            # Skip common markdown reference-style quirks.
-            if target.startswith("<") and target.endswith(">"):
-                continue
+    missing: list[tuple[str, str]] = []
 
-            # Resolve relative to current file.
-            resolved = (md.parent / target).resolve()
-            if not resolved.exists():
-                missing.append((md, target_raw))
+    # Files are independent and the work is read/stat dominated, which
+    # releases the GIL, so a small thread pool scans them concurrently.
+    # map() preserves input order, keeping the report deterministic.
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(md_files)))) as pool:
+        checker = partial(_check_file, root=root, known=known, known_dirs=known_dirs)
+        for file_missing in pool.map(checker, md_files):
+            missing.extend(file_missing)
 
     if missing:
         print("Broken relative links detected:\n")
-        for md, target in missing:
-            print(f"- {md.relative_to(root)} -> {target}")
+        for md_rel, target in missing:
+            print(f"- {md_rel} -> {target}")
         print(f"\nTotal: {len(missing)}")
         return 1
 